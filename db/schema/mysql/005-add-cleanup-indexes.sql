@@ -0,0 +1,16 @@
+/*
+ * @file 005-add-cleanup-indexes.sql
+ * @description
+ * Secondary indexes for the batched cleanup deletes in
+ * services/ai-service/clear_all_data.py (DELETE ... WHERE airline = ... LIMIT n
+ * and DELETE ... WHERE name LIKE 'Hotel in %' LIMIT n), so each batch is an
+ * index range scan instead of a full table scan.
+ *
+ * Kept out of 001 because its CREATE TABLE IF NOT EXISTS is a no-op on
+ * databases that already exist. Run this once, after 001:
+ * ALTER TABLE ... ADD INDEX fails if the index is already there.
+ */
+
+ALTER TABLE hotels ADD INDEX idx_hotels_name (name);
+
+ALTER TABLE flights ADD INDEX idx_flights_airline (airline);
@@ -1,8 +1,44 @@
 import re
 import json
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from app.agents.deals_agent import deals_agent
 
+# Strategy A date cue ("on/from/starting" + date), compiled once at import.
+# Word boundaries avoid matching "Option" -> "on"; 25 chars catch "January 10th 2026".
+# The date class excludes "$" and "." so prices ("Option 1 Vistara - $2476.0") never
+# read as dates, and the trailing \b stops the capture on a whole token.
+_DATE_RE = re.compile(r'\b(?:on|from|starting)\b\s+(?P<date>[a-z0-9,/\- ]{4,25})\b')
+# Cheap substring pre-filter so messages without any cue word skip the regex
+_DATE_CUES = ("on ", "from ", "starting ")
+
+# Intent/amenity keywords, matched as plain substrings like the original `kw in text`
+# checks. None is a substring of another, so one left-to-right scan finds them all.
+_INTENT_AMENITY_KEYWORDS = ["pet", "pool", "wifi", "breakfast", "gym", "spa", "parking", "ocean", "mountain", "friendly"]
+_KNOWN_AMENITIES = ["wifi", "pool", "spa", "pet", "dog", "gym", "breakfast", "parking", "ocean", "sea", "mountain"]
+_KEYWORDS = [
+    "watch", "track", "alert",
+    "book", "select", "choose", "chose", "go with", "pick",
+    "bundle", "package",
+    "flight", "show", "again", "list",
+    "hotel", "trip", "plan",
+    *_INTENT_AMENITY_KEYWORDS, "dog", "sea",
+]
+_KEYWORD_RE = re.compile("|".join(re.escape(kw) for kw in dict.fromkeys(_KEYWORDS)))
+
+# Remaining entity patterns, compiled once at import (all run on lowercased text)
+_ORIGIN_RE = re.compile(r'\b(from|departing|leaving)\s+(?P<origin>[a-zA-Z\s]+?)(?=\s+(to|for|on)|$)')
+_BUDGET_RE = re.compile(r'(\$|budget\s?|under\s?)(?P<amt>\d+)')
+# Matches: "dec 25", "december 25th", "jan 1", OR "in december" (optional day and year)
+_MONTH_FALLBACK_RE = re.compile(r"(in\s)?(?P<mon>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?(\s+\d{1,2}(st|nd|rd|th)?)?(\s+\d{4})?")
+_TRAVELERS_RE = re.compile(r'(\d+)\s*(adults?|guests?|people|pax|travellers?)|family of\s*(\d+)')
+_NIGHTS_RE = re.compile(r'for\s+(\d+)\s*(nights?|days?)')
+# Selection by position ("option 2", "pick number 5", "bundle 3", "#1") in one pass
+_INDEX_RE = re.compile(r'(option|number|bundle|#)\s?(?P<idx>\d+)')
+_AIRLINE_RE = re.compile(r'(go with|choose|select|book|chose)\s+(?P<airline>\w+)')
+
+KNOWN_CITIES = ["Mumbai", "Delhi", "Bangalore", "Goa", "Chennai", "Paris", "Tokyo", "London", "Dubai", "New York"]
+
 class SimpleNLU:
     """
     A 'Dumb' NLU that uses Regex to extract intent and entities.
@@ -10,7 +46,14 @@ class SimpleNLU:
     """
     def __init__(self):
         # Cache known cities for better matching
-        self.known_cities = ["Mumbai", "Delhi", "Bangalore", "Goa", "Chennai", "Paris", "Tokyo", "London", "Dubai", "New York"]
+        self.known_cities = list(KNOWN_CITIES)
+        # (lowercase, display) pairs in priority order; lowered once, not per message
+        self._cities = [(city.lower(), city) for city in self.known_cities]
+        # One alternation over every city (longest first), so a message is scanned
+        # once instead of once per city
+        self._city_re = re.compile("|".join(
+            re.escape(city_lower) for city_lower in sorted(dict(self._cities), key=len, reverse=True)
+        ))
 
     def extract(self, text: str) -> dict:
         text = text.lower()
@@ -25,44 +68,53 @@ class SimpleNLU:
             "amenities": None
         }
         
+        # Every intent/amenity keyword present, from a single scan of the text
+        hits = set(_KEYWORD_RE.findall(text))
+
         # 1. Detect Intent
         # FIX: Detect "refine" intent when amenity keywords are present (pet, pool, wifi, etc.)
-        amenity_keywords = ["pet", "pool", "wifi", "breakfast", "gym", "spa", "parking", "ocean", "mountain", "friendly"]
-        has_amenity_keyword = any(kw in text for kw in amenity_keywords)
+        has_amenity_keyword = not hits.isdisjoint(_INTENT_AMENITY_KEYWORDS)
         
         # PRIORITY ORDER: watch > book > combine > bundle > show_flights > refine > search
-        if "watch" in text or "track" in text or "alert" in text:
+        if hits & {"watch", "track", "alert"}:
             result["intent"] = "watch"
-        elif "book" in text or "select" in text or "choose" in text or "chose" in text or "go with" in text or "pick" in text:
+        elif hits & {"book", "select", "choose", "chose", "go with", "pick"}:
             result["intent"] = "book"
-        elif "bundle" in text or "package" in text or "show bundle" in text:
+        elif hits & {"bundle", "package"}:
             result["intent"] = "bundle"
-        elif "flight" in text and ("show" in text or "again" in text or "list" in text):
+        elif "flight" in hits and hits & {"show", "again", "list"}:
             result["intent"] = "show_flights"
-        elif "hotel" in text or "only hotel" in text or has_amenity_keyword:
+        elif "hotel" in hits or has_amenity_keyword:
              result["intent"] = "refine"
              result["airline"] = "hotel" # usage hack
-        elif "trip" in text or "plan" in text:
+        elif hits & {"trip", "plan"}:
             result["intent"] = "search"
         # NOTE: "show flights" triggers show_flights, not search
+
+        # A bare positional pick ("Option 2") is a booking even without a verb;
+        # only the whole message counts, so "Is option 2 refundable?" stays a search
+        index_match = _INDEX_RE.search(text)
+        if result["intent"] == "search" and _INDEX_RE.fullmatch(text.strip(" .!")):
+            result["intent"] = "book"
             
         # ... (Dest/Budget Logic same) ...
         # 2. Detect Destination (Naive match against known list)
         # Fix: Ensure matched city isn't actually the Origin ("from Mumbai")
-        origin_match = re.search(r'\b(from|departing|leaving)\s+(?P<origin>[a-zA-Z\s]+?)(?=\s+(to|for|on)|$)', text)
+        origin_match = _ORIGIN_RE.search(text)
         found_origin = origin_match.group("origin").strip().lower() if origin_match else ""
 
-        for city in self.known_cities:
-            if city.lower() in text:
+        found = set(self._city_re.findall(text))
+        for city_lower, city in self._cities:
+            if city_lower in found:
                 # If this city is exactly the origin, ignore it as destination
-                if city.lower() == found_origin:
+                if city_lower == found_origin:
                     continue
                 result["destination"] = city
-                break # Take first match
+                break # Take first match (known-city order)
                 
         # 3. Detect Budget (Regex: $500, 500 dollars, budget 500)
         # Match $1000 or 1000
-        budget_match = re.search(r'(\$|budget\s?|under\s?)(?P<amt>\d+)', text)
+        budget_match = _BUDGET_RE.search(text)
         if budget_match:
             try:
                 result["budget"] = float(budget_match.group("amt"))
@@ -71,42 +123,30 @@ class SimpleNLU:
                 
         # 4. Detect Dates (Improved)
         # Strategy A: Look for "on/from/starting" + date
-        # Fix: Use word boundaries \b to avoid matching "Option" -> "on"
-        # 4. Detect Dates (Improved)
-        # Strategy A: Look for "on/from/starting" + date
-    # Fix: Use word boundaries \b to avoid matching "Option" -> "on"
-    # Fix: Increase capture length to 25 to catch "January 10th 2026"
-        date_match = re.search(r'\b(on|from|starting)\b\s+(?P<date>.{4,25})', text)
+        date_match = _DATE_RE.search(text) if any(cue in text for cue in _DATE_CUES) else None
         if date_match:
-             raw = date_match.group("date").split(" to ")[0].split(" for ")[0].strip()
+             raw = date_match.group("date").partition(" to ")[0].partition(" for ")[0].strip()
              # Fix for "from London": check if raw is a city
-             is_city = False
-             for c in self.known_cities:
-                 if c.lower() in raw.lower():
-                     is_city = True
-                     break
+             is_city = self._city_re.search(raw) is not None
              if not is_city:
                   result["dates"] = raw
         
         # Strategy B: Fallback (Month names) - Runs if A failed or was rejected
         if not result["dates"]:
-             # Matches: "dec 25", "december 25th", "jan 1", OR "in december"
              # Fix: Allow optional day part AND OPTIONAL YEAR
-             months = r"(in\s)?(?P<mon>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?(\s+\d{1,2}(st|nd|rd|th)?)?(\s+\d{4})?"
-             fallback_match = re.search(months, text)
+             fallback_match = _MONTH_FALLBACK_RE.search(text)
              if fallback_match:
                  # Clean up "in " prefix if captured in group 0
                  raw = fallback_match.group(0).replace("in ", "")
                  result["dates"] = raw.strip()
                  
-        # 5. Detect Origin (from X)
-        origin_match = re.search(r'\b(from|departing|leaving)\s+(?P<origin>[a-zA-Z\s]+?)(?=\s+(to|for|on)|$)', text)
+        # 5. Detect Origin (from X) - reuses the match from step 2
         if origin_match:
              result["origin"] = origin_match.group("origin").strip().title() # Capitalize for UI
 
         # 6. Detect Travelers (2 adults, 3 people, family of 4)
         # Matches: "2 adults", "3 guests", "family of 4"
-        trav_match = re.search(r'(\d+)\s*(adults?|guests?|people|pax|travellers?)|family of\s*(\d+)', text)
+        trav_match = _TRAVELERS_RE.search(text)
         if trav_match:
              # Group 1 or Group 3 (family size)
              count = trav_match.group(1) or trav_match.group(3)
@@ -114,29 +154,24 @@ class SimpleNLU:
 
         # 7. Detect Nights/Duration
         # Matches: "for 3 nights", "5 days"
-        night_match = re.search(r'for\s+(\d+)\s*(nights?|days?)', text)
+        night_match = _NIGHTS_RE.search(text)
         if night_match:
              result["nights"] = int(night_match.group(1))
 
         # 8. Detect Amenities (Keywords)
-        known_amenities = ["wifi", "pool", "spa", "pet", "dog", "gym", "breakfast", "parking", "ocean", "sea", "mountain"]
-        found_tags = []
-        for tag in known_amenities:
-            if tag in text:
-                found_tags.append(tag)
+        found_tags = [tag for tag in _KNOWN_AMENITIES if tag in hits]
         if found_tags:
             result["amenities"] = found_tags
 
         # SPECIAL: Extract Airline for selection if booking
         # "Lets go with Vistara" or "Book bundle 3"
         if result["intent"] == "book":
-             # A. Look for "Option X", "Number X", or "Bundle X"
-             index_match = re.search(r'(option|number|bundle|#)\s?(?P<idx>\d+)', text)
+             # A. "Option X", "Number X", or "Bundle X" (matched above)
              if index_match:
                  result["index"] = int(index_match.group("idx"))
              
              # B. Look for Airline Name
-             airline_match = re.search(r'(go with|choose|select|book|chose)\s+(?P<airline>\w+)', text)
+             airline_match = _AIRLINE_RE.search(text)
              if airline_match:
                   # Avoid capturing "Option" as airline if user says "Choose Option"
                   candidate = airline_match.group("airline")
@@ -145,10 +180,147 @@ class SimpleNLU:
                       
         return result
 
+# normalize_date lookup tables
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12
+}
+_MONTH_BY_PREFIX = {k: v for k, v in _MONTHS.items() if len(k) == 3}
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_ORDINAL_SUFFIX_RE = re.compile(r'(\d+)(st|nd|rd|th)')
+# "3rd January 2026" (checked first), then "January 3rd 2026" / "Dec 25", then "in December"
+_DAY_MONTH_RE = re.compile(r'(\d{1,2})(?:st|nd|rd|th)?\s+([a-z]+)\.?\s*(?P<year>\d{4})?')
+_MONTH_DAY_RE = re.compile(r'([a-z]+)\.?\s+(\d{1,2})(?:st|nd|rd|th)?(?:,)?\s*(?P<year>\d{4})?')
+_WORD_RE = re.compile(r'([a-z]+)')
+_NUMBER_RE = re.compile(r'\d+')
+_NUMERIC_DATE_RE = re.compile(r'\d{1,2}[-/]\d{1,2}')
+# Whole-message relative phrases, answered before any month/relative regex runs
+_RELATIVE_DAYS = {"tomorrow": 1, "tmrw": 1}
+
+def _month_number(name: str) -> int:
+    """Month for a word like 'dec' or 'december' (0 if none): one dict hit by 3-letter
+    prefix, falling back to the old any-substring scan for odd spellings."""
+    month = _MONTH_BY_PREFIX.get(name[:3])
+    if month:
+        return month
+    for k, v in _MONTHS.items():
+        if k in name:
+            return v
+    return 0
+
+@lru_cache(maxsize=1024)
+def _normalize_date(date_str: str, today: date) -> str:
+    """
+    Cached core of ConciergeAgent.normalize_date. Pure in (date_str, today),
+    so repeated phrases ("December 25th", "in 2 weeks") parse once per day.
+    Callers filter out empty input before reaching the cache.
+    """
+    # Already correct format?
+    if _ISO_DATE_RE.match(date_str):
+        return date_str
+        
+    try:
+        # Basic parsing strategy for typical NLU outputs
+        # Clean up suffixes like 'st', 'nd', 'rd', 'th'
+        clean = _ORDINAL_SUFFIX_RE.sub(r'\1', date_str.lower())
+
+        relative_days = _RELATIVE_DAYS.get(clean.strip())
+        if relative_days is not None:
+            return (today + timedelta(days=relative_days)).strftime("%Y-%m-%d")
+        
+        # Current context for Year Logic
+        current_year = today.year
+        current_month = today.month
+
+        # Helper to guess year
+        def guess_year(m_num):
+             # If month is earlier than current month, assume next year (e.g. Jan search in Dec)
+             # Unless user explicitly said 2025
+             if m_num < current_month:
+                 return current_year + 1
+             return current_year
+
+        # Regex 2: Day Month (Year) - CHECK FIRST
+        # e.g. "3rd January 2026"
+        match_dmy = _DAY_MONTH_RE.search(clean)
+        if match_dmy:
+            day = int(match_dmy.group(1))
+            month_name = match_dmy.group(2)
+            year_str = match_dmy.group("year")
+            
+            month = _month_number(month_name)
+            
+            if month > 0:
+                y = int(year_str) if year_str else guess_year(month)
+                return f"{y}-{month:02d}-{day:02d}"
+
+        # Regex 1: Month Day (Year)
+        # e.g. "January 3rd 2026", "Dec 25"
+        match = _MONTH_DAY_RE.search(clean)
+        if match:
+            month_name = match.group(1)
+            day = int(match.group(2))
+            year_str = match.group("year")
+            
+            # Find month num
+            month = _month_number(month_name)
+            
+            if month > 0:
+                y = int(year_str) if year_str else guess_year(month)
+                return f"{y}-{month:02d}-{day:02d}"
+
+        # Fallback: Month only ("in December") -> "YYYY-MM" for partial match
+        month_only_match = _WORD_RE.search(clean)
+        if month_only_match:
+             m_name = month_only_match.group(1)
+             m_num = _month_number(m_name)
+             if m_num > 0:
+                  y = guess_year(m_num)
+                  return f"{y}-{m_num:02d}" # YYYY-MM for fuzzy search
+        
+        # Relative Date Logic ("in 2 weeks", "next weekend")
+        now = today
+        
+        if "week" in clean:
+            # "in 2 weeks", "next week"
+            nums = _NUMBER_RE.findall(clean)
+            weeks = int(nums[0]) if nums else 1
+            future = now + timedelta(weeks=weeks)
+            return future.strftime("%Y-%m-%d")
+        
+        if "day" in clean:
+            nums = _NUMBER_RE.findall(clean)
+            days = int(nums[0]) if nums else 1
+            future = now + timedelta(days=days)
+            return future.strftime("%Y-%m-%d")
+
+        if "tomorrow" in clean:
+            future = now + timedelta(days=1)
+            return future.strftime("%Y-%m-%d")
+            
+    except Exception as e:
+        print(f"Date Normalization Error: {e}")
+        
+    # FIX: Return None if input doesn't look like a valid date (no month name or date pattern)
+    if date_str and not any(m in date_str.lower() for m in _MONTH_BY_PREFIX) and not _NUMERIC_DATE_RE.search(date_str):
+        return None
+    return date_str
+
+@lru_cache(maxsize=1)
+def get_nlu() -> SimpleNLU:
+    """Shared SimpleNLU instance; it holds no per-conversation state."""
+    return SimpleNLU()
+
 class ConciergeAgent:
     def __init__(self):
-        self.nlu = SimpleNLU()
-        self.nlu = SimpleNLU()
+        # NLU is stateless and shared; everything else is per-conversation state
+        self.nlu = get_nlu()
+        self.reset()
+
+    def reset(self):
+        """Start a fresh conversation (lets tests reuse one agent instance)."""
         self.current_context = {
             "destination": None, 
             "origin": None,
@@ -210,123 +382,18 @@ class ConciergeAgent:
             session.commit()
             return True
 
-    def normalize_date(self, date_str: str) -> str:
+    def normalize_date(self, date_str: str, *, today: date | None = None) -> str:
         """
         Convert natural language dates (e.g. 'December 25th', 'dec 25') 
         to YYYY-MM-DD SQL format.
-        Assuming current/next year.
+        Assuming current/next year relative to `today` (defaults to date.today()).
         """
         if not date_str: return None
-        
-        # Already correct format?
-        if re.match(r'\d{4}-\d{2}-\d{2}', date_str):
-            return date_str
-            
-        try:
-            # Basic parsing strategy for typical NLU outputs
-            # Clean up suffixes like 'st', 'nd', 'rd', 'th'
-            clean = re.sub(r'(\d+)(st|nd|rd|th)', r'\1', date_str.lower())
-            
-            # Map month names
-            months = {
-                'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-                'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
-                'january': 1, 'february': 2, 'march': 3, 'april': 4, 'june': 6,
-                'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12
-            }
-            
-            # Current context for Year Logic
-            now = datetime.now()
-            current_year = now.year
-            current_month = now.month
-
-            # Helper to guess year
-            def guess_year(m_num):
-                 # If month is earlier than current month, assume next year (e.g. Jan search in Dec)
-                 # Unless user explicitly said 2025
-                 if m_num < current_month:
-                     return current_year + 1
-                 return current_year
-
-            # Regex 2: Day Month (Year) - CHECK FIRST
-            # e.g. "3rd January 2026"
-            match_dmy = re.search(r'(\d{1,2})(?:st|nd|rd|th)?\s+([a-z]+)\.?\s*(?P<year>\d{4})?', clean)
-            if match_dmy:
-                day = int(match_dmy.group(1))
-                month_name = match_dmy.group(2)
-                year_str = match_dmy.group("year")
-                
-                month = 0
-                for k, v in months.items():
-                    if k in month_name:
-                         month = v
-                         break
-                
-                if month > 0:
-                    y = int(year_str) if year_str else guess_year(month)
-                    return f"{y}-{month:02d}-{day:02d}"
-
-            # Regex 1: Month Day (Year)
-            # e.g. "January 3rd 2026", "Dec 25"
-            match = re.search(r'([a-z]+)\.?\s+(\d{1,2})(?:st|nd|rd|th)?(?:,)?\s*(?P<year>\d{4})?', clean)
-            if match:
-                month_name = match.group(1)
-                day = int(match.group(2))
-                year_str = match.group("year")
-                
-                # Find month num
-                month = 0
-                for k, v in months.items():
-                    if k in month_name:
-                         month = v
-                         break
-                
-                if month > 0:
-                    y = int(year_str) if year_str else guess_year(month)
-                    return f"{y}-{month:02d}-{day:02d}"
-
-            # Fallback: Month only ("in December") -> "YYYY-MM" for partial match
-            month_only_match = re.search(r'([a-z]+)', clean)
-            if month_only_match:
-                 m_name = month_only_match.group(1)
-                 m_num = 0
-                 for k, v in months.items():
-                    if k in m_name:
-                         m_num = v
-                         break
-                 if m_num > 0:
-                      y = guess_year(m_num)
-                      return f"{y}-{m_num:02d}" # YYYY-MM for fuzzy search
-            
-            # Relative Date Logic ("in 2 weeks", "next weekend")
-            from datetime import timedelta
-            now = datetime.now()
-            
-            if "week" in clean:
-                # "in 2 weeks", "next week"
-                nums = re.findall(r'\d+', clean)
-                weeks = int(nums[0]) if nums else 1
-                future = now + timedelta(weeks=weeks)
-                return future.strftime("%Y-%m-%d")
-            
-            if "day" in clean:
-                nums = re.findall(r'\d+', clean)
-                days = int(nums[0]) if nums else 1
-                future = now + timedelta(days=days)
-                return future.strftime("%Y-%m-%d")
-
-            if "tomorrow" in clean:
-                future = now + timedelta(days=1)
-                return future.strftime("%Y-%m-%d")
-                
-        except Exception as e:
-            print(f"Date Normalization Error: {e}")
-            
-        # FIX: Return None if input doesn't look like a valid date (no month name or date pattern)
-        months = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
-        if date_str and not any(m in date_str.lower() for m in months) and not re.search(r'\d{1,2}[-/]\d{1,2}', date_str):
-            return None
-        return date_str
+        return _normalize_date(date_str, today or date.today())
+
+    def process_messages(self, messages, user_token: str = None) -> list:
+        """Run scripted turns in order on this conversation; one reply per message."""
+        return [self.process_message(m, user_token) for m in messages]
 
     def process_message(self, message: str, user_token: str = None) -> str:
         extracted = self.nlu.extract(message)
@@ -355,12 +422,8 @@ class ConciergeAgent:
         elif self.awaiting_slot == "check_out" and not self.current_context.get("check_out"):
             # This could be a date OR "3 nights"
             if "night" in message.lower():
-                import re
                 try:
-                    # ensure imports
-                    from datetime import datetime, timedelta
-                    
-                    matches = re.findall(r'\d+', message)
+                    matches = _NUMBER_RE.findall(message)
                     if matches:
                         nights = int(matches[0])
                         # Calculate Check Out
@@ -399,7 +462,7 @@ class ConciergeAgent:
                  self.current_context["travelers"] = extracted["travelers"]
              else:
                  # Try finding digit in raw text
-                 d_match = re.search(r'\d+', message)
+                 d_match = _NUMBER_RE.search(message)
                  if d_match:
                      self.current_context["travelers"] = int(d_match.group(0))
                  elif "me" in message.lower():
@@ -416,8 +479,7 @@ class ConciergeAgent:
         # FIX: Only update dates if NLU found a VALID date (contains month name or digits)
         if extracted["dates"]:
             date_str = extracted["dates"].lower()
-            months = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
-            is_valid_date = any(m in date_str for m in months) or re.search(r'\d{1,2}', date_str)
+            is_valid_date = any(m in date_str for m in _MONTH_BY_PREFIX) or _NUMBER_RE.search(date_str)
             if is_valid_date:
                 self.current_context["dates"] = extracted["dates"]
         
@@ -750,22 +812,14 @@ class ConciergeAgent:
         """
         Syncs hotel to MySQL and Creates Booking (Demo Only).
         """
-        import pymysql
         import uuid
+        from app.db_pool import get_connection
         
         DEMO_USER_EMAIL = "akshay.menon@usa.com"
         
         try:
-            import os
-            conn = pymysql.connect(
-                host=os.getenv('MYSQL_HOST', 'localhost'),
-                user=os.getenv('MYSQL_USER', 'kayak_user'),
-                password=os.getenv('MYSQL_PASSWORD', 'kayak_pass'),
-                database=os.getenv('MYSQL_DATABASE', 'kayak_core'),
-                port=int(os.getenv('MYSQL_PORT', '3306')),
-                cursorclass=pymysql.cursors.DictCursor
-            )
-            with conn.cursor() as cursor:
+            # Pooled connection; returned to the pool on every exit path
+            with get_connection() as conn, conn.cursor() as cursor:
                 # 1. Sync Hotel
                 # Use hotel_id if present, else generate
                 h_id = str(hotel_data.get('id'))
@@ -848,8 +902,8 @@ class ConciergeAgent:
                     
                     conn.commit()
                     print(f"DEBUG: Demo Hotel Booking Created: {ref}")
-                    return {"id": booking_id, "status": "confirmed", "reference": ref}
-            conn.close()
+                    # start_date as persisted (None when the DB defaulted it to NOW())
+                    return {"id": booking_id, "status": "confirmed", "reference": ref, "start_date": start_date}
         except Exception as e:
             print(f"Hotel Booking Error: {e}")
             raise e
@@ -913,144 +967,141 @@ class ConciergeAgent:
         """
         Syncs flight to MySQL and Creates Booking (Demo Mode Support).
         """
-        import pymysql
         import requests
         import uuid
+        from app.db_pool import get_connection
         
         # DEMO MODE USER (Fallback)
         DEMO_USER_EMAIL = "akshay.menon@usa.com"
         
         # 1. Sync flight to MySQL to ensure it exists
         try:
-            import os
-            conn = pymysql.connect(
-                host=os.getenv('MYSQL_HOST', 'localhost'),
-                user=os.getenv('MYSQL_USER', 'kayak_user'),
-                password=os.getenv('MYSQL_PASSWORD', 'kayak_pass'),
-                database=os.getenv('MYSQL_DATABASE', 'kayak_core'),
-                port=int(os.getenv('MYSQL_PORT', '3306')),
-                cursorclass=pymysql.cursors.DictCursor
-            )
+            # Pooled connection; returned to the pool on every exit path
+            with get_connection() as conn:
             
-            def ensure_airport(cursor, city):
-                # 1. Check by City
-                cursor.execute("SELECT id FROM airports WHERE city = %s LIMIT 1", (city,))
-                res = cursor.fetchone()
-                if res: return res['id']
+                def ensure_airport(cursor, city):
+                    # 1. Check by City
+                    cursor.execute("SELECT id FROM airports WHERE city = %s LIMIT 1", (city,))
+                    res = cursor.fetchone()
+                    if res: return res['id']
                 
-                # 2. Check by IATA to avoid Unique Key Failure
-                iata = city[:3].upper()
-                cursor.execute("SELECT id FROM airports WHERE iata_code = %s LIMIT 1", (iata,))
-                res = cursor.fetchone()
-                if res: return res['id']
+                    # 2. Check by IATA to avoid Unique Key Failure
+                    iata = city[:3].upper()
+                    cursor.execute("SELECT id FROM airports WHERE iata_code = %s LIMIT 1", (iata,))
+                    res = cursor.fetchone()
+                    if res: return res['id']
                 
-                # 3. Insert New
-                new_id = str(uuid.uuid4())
-                cursor.execute("INSERT INTO airports (id, iata_code, name, city, country, created_at, updated_at) VALUES (%s, %s, %s, %s, 'Unknown', NOW(), NOW())", (new_id, iata, f"{city} Airport", city))
-                conn.commit()
-                return new_id
-
-            with conn.cursor() as cursor:
-                # A. Enasure Flight Entitites
-                origin_id = ensure_airport(cursor, flight_data.get('origin', 'Unknown'))
-                dest_id = ensure_airport(cursor, flight_data.get('destination', 'Unknown'))
-                
-                cursor.execute("SELECT id FROM flights WHERE id = %s", (flight_data['id'],))
-                if not cursor.fetchone():
-                    # Sync
-                    sql_insert = """
-                    INSERT INTO flights (
-                        id, flight_number, airline, origin_airport_id, destination_airport_id, 
-                        departure_time, arrival_time, total_duration_minutes, stops, 
-                        base_price, currency, seats_available, is_active, created_at, updated_at
-                    )
-                    VALUES (%s, %s, %s, %s, %s, NOW(), DATE_ADD(NOW(), INTERVAL 120 MINUTE), 120, 0, %s, 'USD', 100, 1, NOW(), NOW())
-                    """
-                    cursor.execute(sql_insert, (
-                        flight_data['id'],
-                        f"AI-{str(uuid.uuid4())[:4]}",
-                        flight_data.get('airline', 'Unknown'),
-                        origin_id,
-                        dest_id,
-                        float(flight_data.get('price', 100))
-                    ))
+                    # 3. Insert New
+                    new_id = str(uuid.uuid4())
+                    cursor.execute("INSERT INTO airports (id, iata_code, name, city, country, created_at, updated_at) VALUES (%s, %s, %s, %s, 'Unknown', NOW(), NOW())", (new_id, iata, f"{city} Airport", city))
                     conn.commit()
+                    return new_id
+
+                with conn.cursor() as cursor:
+                    # A. Enasure Flight Entitites
+                    origin_id = ensure_airport(cursor, flight_data.get('origin', 'Unknown'))
+                    dest_id = ensure_airport(cursor, flight_data.get('destination', 'Unknown'))
+                
+                    cursor.execute("SELECT id FROM flights WHERE id = %s", (flight_data['id'],))
+                    if not cursor.fetchone():
+                        # Sync
+                        sql_insert = """
+                        INSERT INTO flights (
+                            id, flight_number, airline, origin_airport_id, destination_airport_id, 
+                            departure_time, arrival_time, total_duration_minutes, stops, 
+                            base_price, currency, seats_available, is_active, created_at, updated_at
+                        )
+                        VALUES (%s, %s, %s, %s, %s, NOW(), DATE_ADD(NOW(), INTERVAL 120 MINUTE), 120, 0, %s, 'USD', 100, 1, NOW(), NOW())
+                        """
+                        cursor.execute(sql_insert, (
+                            flight_data['id'],
+                            f"AI-{str(uuid.uuid4())[:4]}",
+                            flight_data.get('airline', 'Unknown'),
+                            origin_id,
+                            dest_id,
+                            float(flight_data.get('price', 100))
+                        ))
+                        conn.commit()
                     
-                # B. EXECUTE BOOKING (Direct to DB for Demo/Pilot)
-                # If we are here, we likely don't have a valid JWT for the user in this No-API mode.
-                # So we manually insert the booking for 'aksahy.menon@usa.com'
+                    # B. EXECUTE BOOKING (Direct to DB for Demo/Pilot)
+                    # If we are here, we likely don't have a valid JWT for the user in this No-API mode.
+                    # So we manually insert the booking for 'aksahy.menon@usa.com'
                 
-                # 2. Find User
-                user_id = None
+                    # 2. Find User
+                    user_id = None
                 
-                # A. Try Auth Token (Real User)
-                if auth_token and auth_token != "demo-token":
-                    try:
-                        import jwt
-                        # Decode payload 
-                        decoded = jwt.decode(auth_token, options={"verify_signature": False})
-                        user_id = decoded.get("id") or decoded.get("userId") or decoded.get("sub")
-                        print(f"DEBUG: Flight Booking for Real User ID: {user_id}")
-                    except Exception as e:
-                        print(f"WARN: Token decode failed {e}")
+                    # A. Try Auth Token (Real User)
+                    if auth_token and auth_token != "demo-token":
+                        try:
+                            import jwt
+                            # Decode payload 
+                            decoded = jwt.decode(auth_token, options={"verify_signature": False})
+                            user_id = decoded.get("id") or decoded.get("userId") or decoded.get("sub")
+                            print(f"DEBUG: Flight Booking for Real User ID: {user_id}")
+                        except Exception as e:
+                            print(f"WARN: Token decode failed {e}")
 
-                # B. Fallback to Demo User (ONLY IF EXPLICIT demo-token)
-                if not user_id and auth_token == "demo-token":
-                    cursor.execute("SELECT id FROM users WHERE email = %s", (DEMO_USER_EMAIL,))
-                    user_rec = cursor.fetchone()
-                    if user_rec:
-                        user_id = user_rec['id']
-                        print(f"DEBUG: Flight Booking for Demo User ID: {user_id}")
+                    # B. Fallback to Demo User (ONLY IF EXPLICIT demo-token)
+                    if not user_id and auth_token == "demo-token":
+                        cursor.execute("SELECT id FROM users WHERE email = %s", (DEMO_USER_EMAIL,))
+                        user_rec = cursor.fetchone()
+                        if user_rec:
+                            user_id = user_rec['id']
+                            print(f"DEBUG: Flight Booking for Demo User ID: {user_id}")
                 
-                if not user_id:
-                     print("ERROR: Could not identify user for booking. Token Invalid.")
-                     return {"status": "error", "message": "User Identification Failed"}
+                    if not user_id:
+                         print("ERROR: Could not identify user for booking. Token Invalid.")
+                         return {"status": "error", "message": "User Identification Failed"}
 
-                if user_id:
-                    booking_id = str(uuid.uuid4())
+                    if user_id:
+                        booking_id = str(uuid.uuid4())
                     
-                    # Determine Date
-                    # FIX: Prioritize the User's Context Date ('date') over the static DB 'departure_time'
-                    requested_date = flight_data.get('date')
-                    static_date = flight_data.get('departure_time')
+                        # Determine Date
+                        # FIX: Prioritize the User's Context Date ('date') over the static DB 'departure_time'
+                        requested_date = flight_data.get('date')
+                        static_date = flight_data.get('departure_time')
                     
-                    if requested_date:
-                         date_val = f"'{requested_date}'"
-                         end_date_val = f"DATE_ADD('{requested_date}', INTERVAL 1 DAY)"
-                    elif static_date and static_date != "N/A":
-                         date_val = f"'{static_date}'"
-                         end_date_val = f"DATE_ADD('{static_date}', INTERVAL 1 DAY)"
-                    else:
-                         date_val = "NOW()"
-                         end_date_val = "DATE_ADD(NOW(), INTERVAL 1 DAY)"
-
-
-                    # Insert Booking
-                    sql_book = f"""
-                    INSERT INTO bookings (
-                        id, user_id, booking_reference, status, total_amount, currency, 
-                        start_date, end_date, created_at, updated_at
-                    ) VALUES (%s, %s, %s, 'confirmed', %s, 'USD', {date_val}, {end_date_val}, NOW(), NOW())
-                    """
-                    ref = f"BK-{str(uuid.uuid4())[:6].upper()}"
-                    cursor.execute(sql_book, (booking_id, user_id, ref, float(flight_data['price'])))
+                        if requested_date:
+                             start_date = requested_date
+                             date_val = f"'{requested_date}'"
+                             end_date_val = f"DATE_ADD('{requested_date}', INTERVAL 1 DAY)"
+                        elif static_date and static_date != "N/A":
+                             # DATE column keeps only the day part of "YYYY-MM-DD HH:MM..."
+                             start_date = static_date[:10]
+                             date_val = f"'{static_date}'"
+                             end_date_val = f"DATE_ADD('{static_date}', INTERVAL 1 DAY)"
+                        else:
+                             start_date = None
+                             date_val = "NOW()"
+                             end_date_val = "DATE_ADD(NOW(), INTERVAL 1 DAY)"
+
+
+                        # Insert Booking
+                        sql_book = f"""
+                        INSERT INTO bookings (
+                            id, user_id, booking_reference, status, total_amount, currency, 
+                            start_date, end_date, created_at, updated_at
+                        ) VALUES (%s, %s, %s, 'confirmed', %s, 'USD', {date_val}, {end_date_val}, NOW(), NOW())
+                        """
+                        ref = f"BK-{str(uuid.uuid4())[:6].upper()}"
+                        cursor.execute(sql_book, (booking_id, user_id, ref, float(flight_data['price'])))
                     
-                    # Insert Booking Line Item (Flight)
-                    sql_item = f"""
-                    INSERT INTO booking_items (
-                        id, booking_id, item_type, flight_id, quantity, unit_price, total_price, currency, 
-                        start_date, end_date, created_at, updated_at
-                    ) VALUES (%s, %s, 'FLIGHT', %s, 1, %s, %s, 'USD', {date_val}, {end_date_val}, NOW(), NOW())
-                    """
-                    item_id = str(uuid.uuid4())
-                    price = float(flight_data['price'])
-                    cursor.execute(sql_item, (item_id, booking_id, flight_data['id'], price, price))
+                        # Insert Booking Line Item (Flight)
+                        sql_item = f"""
+                        INSERT INTO booking_items (
+                            id, booking_id, item_type, flight_id, quantity, unit_price, total_price, currency, 
+                            start_date, end_date, created_at, updated_at
+                        ) VALUES (%s, %s, 'FLIGHT', %s, 1, %s, %s, 'USD', {date_val}, {end_date_val}, NOW(), NOW())
+                        """
+                        item_id = str(uuid.uuid4())
+                        price = float(flight_data['price'])
+                        cursor.execute(sql_item, (item_id, booking_id, flight_data['id'], price, price))
                     
-                    conn.commit()
-                    print(f"DEBUG: Demo Booking Created for {DEMO_USER_EMAIL} (Ref: {ref})")
-                    return {"id": booking_id, "status": "confirmed", "reference": ref}
+                        conn.commit()
+                        print(f"DEBUG: Demo Booking Created for {DEMO_USER_EMAIL} (Ref: {ref})")
+                        # start_date as persisted (None when the DB defaulted it to NOW())
+                        return {"id": booking_id, "status": "confirmed", "reference": ref, "start_date": start_date}
                     
-            conn.close()
         except Exception as e:
             print(f"Booking Error: {e}")
             raise e
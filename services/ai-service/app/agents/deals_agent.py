@@ -2,15 +2,33 @@
 import asyncio
 import json
 import random
+import re
 import statistics
 from datetime import datetime, timezone
 from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
-from sqlmodel import Session, select
+from sqlmodel import Session, and_, col, select
 from app.database import engine
 from app.models import Listing, Flight, Deal
 
 KAFKA_BOOTSTRAP_SERVERS = "localhost:9093"
 
+_ISO_DAY_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_ISO_MONTH_RE = re.compile(r'\d{4}-\d{2}')
+
+
+def departure_date_filter(value: str):
+    """
+    Flight.departure_date condition with the same matches as contains(value).
+    departure_date is an ISO 'YYYY-MM-DD' string, so a full date is an equality
+    and a 'YYYY-MM' month a prefix range, both of which can use ix_flight_date_dest.
+    Anything else (e.g. an un-normalized 'Dec 25') keeps the substring match.
+    """
+    if _ISO_DAY_RE.fullmatch(value):
+        return Flight.departure_date == value
+    if _ISO_MONTH_RE.fullmatch(value):
+        return and_(Flight.departure_date >= value, Flight.departure_date < value + "\xff")
+    return col(Flight.departure_date).contains(value)
+
 class DealsAgent:
     def __init__(self):
         self.producer = None
@@ -235,7 +253,7 @@ class DealsAgent:
                     print(f"DEBUG: Searching Flights for Date: {date}")
                     
                     search_date = date
-                    f_query = f_query.where(Flight.departure_date.contains(search_date))
+                    f_query = f_query.where(departure_date_filter(search_date))
                     
                     # Store query for fallback usage
                     # Note: We execute and check count
@@ -252,7 +270,7 @@ class DealsAgent:
                                  ym = date[:7]
                                  f_query_fallback = select(Flight)
                                  if destination: f_query_fallback = f_query_fallback.where(Flight.destination.contains(destination))
-                                 f_query_fallback = f_query_fallback.where(Flight.departure_date.contains(ym))
+                                 f_query_fallback = f_query_fallback.where(departure_date_filter(ym))
                                  flights = session.exec(f_query_fallback.limit(limit)).all()
                          except:
                              pass
@@ -312,38 +330,48 @@ class DealsAgent:
             return recommendations
 
     def calculate_fit_score(self, flight, hotel, f_med, h_med, budget=None, amenities: list = None) -> int:
-        score = 50 # Base
-        
-        # 1. Price vs Median (Max 30 pts)
-        savings = 0
-        if f_med > 0:
-            savings += (f_med - flight['price']) / f_med
-        if h_med > 0:
-            savings += (h_med - hotel['price']) / h_med
-            
-        # If savings positive, add score
-        score += min(30, int(savings * 50)) 
-        
-        # 2. Amenities (Max 20 pts + Bonus for User Prefs)
-        # Simple keyword match
-        hotel_amenities = hotel.get('amenities', '').lower()
-        if 'wifi' in hotel_amenities: score += 5
-        if 'pool' in hotel_amenities: score += 5
-        if 'breakfast' in hotel_amenities: score += 5
-        if 'spa' in hotel_amenities: score += 5
+        savings = self._savings(flight['price'], f_med) + self._savings(hotel['price'], h_med)
+        amenity_points = self._amenity_points(hotel.get('amenities', '').lower(), amenities)
+        return self._fit_score(savings, amenity_points, flight['price'] + hotel['price'], budget)
+
+    @staticmethod
+    def _savings(price, median) -> float:
+        # Fraction below the candidate median (negative when pricier)
+        if median > 0:
+            return (median - price) / median
+        return 0
+
+    @staticmethod
+    def _amenity_points(hotel_amenities: str, amenities: list = None) -> int:
+        # Simple keyword match (Max 20 pts + Bonus for User Prefs)
+        points = 0
+        if 'wifi' in hotel_amenities: points += 5
+        if 'pool' in hotel_amenities: points += 5
+        if 'breakfast' in hotel_amenities: points += 5
+        if 'spa' in hotel_amenities: points += 5
         
         # Boost for matching user request
         if amenities:
             match_count = 0
             for req in amenities:
                 if req.lower() in hotel_amenities:
-                    score += 15 # Big boost for explicit user request
+                    points += 15 # Big boost for explicit user request
                     match_count += 1
             if match_count == len(amenities):
-                score += 10 # Perfect match bonus
+                points += 10 # Perfect match bonus
+        return points
+
+    @staticmethod
+    def _fit_score(savings: float, amenity_points: int, total: float, budget=None) -> int:
+        score = 50 # Base
+        
+        # 1. Price vs Median (Max 30 pts)
+        score += min(30, int(savings * 50)) 
+        
+        # 2. Amenities
+        score += amenity_points
         
         # 3. Budget adherence (Max 10 pts)
-        total = flight['price'] + hotel['price']
         if budget and total <= budget:
             score += 10
             
@@ -453,26 +481,33 @@ class DealsAgent:
         candidates_f = flights[:5]
         candidates_h = hotels[:5]
         
+        # Per-item features are computed once here rather than once per
+        # Flight x Hotel pair; the pair loop below is plain arithmetic.
+        wanted = [a.lower() for a in amenities] if amenities else []
+        flight_savings = [self._savings(f['price'], f_med) for f in candidates_f]
+        hotel_features = []
+        for h in candidates_h:
+            hotel_amenities = (h.get('amenities') or '').lower()
+            # Hard filter for "Refine": "Make it pet friendly" means MUST be pet friendly,
+            # so a hotel missing ANY requested amenity never enters a bundle.
+            if any(a not in hotel_amenities for a in wanted):
+                continue
+            hotel_features.append((
+                h,
+                self._savings(h['price'], h_med),
+                self._amenity_points(hotel_amenities, amenities),
+                self.extract_policy_snippets(h),
+            ))
+        
         bundles = []
-        for f in candidates_f:
-            for h in candidates_h:
+        for f, f_savings in zip(candidates_f, flight_savings):
+            for h, h_savings, amenity_points, policies in hotel_features:
                 total_price = f['price'] + h['price']
                 if budget and total_price > budget:
                     continue
                 
-                # Check Amenities (Soft Filter - Score Penalty if missing? Or Hard Filter?)
-                # User Request: "Refine without starting over... preserve earlier context, regenerate options that respect new constraints"
-                # Implies Hard Filter for "Refine" -> "Make it pet friendly" means MUST be pet friendly.
-                if amenities:
-                    hotel_amenities = h.get('amenities', '').lower()
-                    # Check if ALL requested amenities are present
-                    missing = [a for a in amenities if a.lower() not in hotel_amenities]
-                    if missing:
-                        continue # Skip this hotel
-                
-                score = self.calculate_fit_score(f, h, f_med, h_med, budget, amenities)
+                score = self._fit_score(f_savings + h_savings, amenity_points, total_price, budget)
                 explanation = self.generate_explanations(f, h, f_med, h_med, amenities)
-                policies = self.extract_policy_snippets(h)
                 
                 bundles.append({
                     "id": f"b_{f['id']}_{h['id']}",
@@ -0,0 +1,78 @@
+import os
+import queue
+from contextlib import contextmanager
+
+# PyMySQL (requirements.txt) by default; MYSQL_DRIVER=mysqlclient opts into the
+# C-extension driver, which must be installed separately. Both are DB-API drivers
+# with the same calls, and this pool also serves book_hotel/book_flight.
+if os.getenv("MYSQL_DRIVER", "pymysql") == "mysqlclient":
+    import MySQLdb as _driver
+    import MySQLdb.cursors as _cursors
+else:
+    import pymysql as _driver
+    import pymysql.cursors as _cursors
+
+# Driver-neutral cursor classes for conn.cursor(...)
+DictCursor = _cursors.DictCursor
+TupleCursor = _cursors.Cursor
+
+MYSQL_CONFIG = {
+    "host": os.getenv("MYSQL_HOST", "localhost"),
+    "user": os.getenv("MYSQL_USER", "kayak_user"),
+    "password": os.getenv("MYSQL_PASSWORD", "kayak_pass"),
+    "database": os.getenv("MYSQL_DATABASE", "kayak_core"),
+    "port": int(os.getenv("MYSQL_PORT", "3306")),
+    "cursorclass": DictCursor,
+}
+
+POOL_SIZE = int(os.getenv("MYSQL_POOL_SIZE", "4"))
+
+# Idle connections, most recently returned first (LIFO keeps the warm ones in use)
+_pool = queue.LifoQueue(maxsize=POOL_SIZE)
+
+
+def _acquire():
+    try:
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        return _driver.connect(**MYSQL_CONFIG)
+    # Re-open transparently if the server dropped the idle connection
+    try:
+        conn.ping()
+    except _driver.Error:
+        conn.close()
+        return _driver.connect(**MYSQL_CONFIG)
+    return conn
+
+
+def _release(conn):
+    try:
+        _pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+
+@contextmanager
+def get_connection():
+    """Borrow a pooled MySQL (kayak_core) connection; it is returned on exit.
+
+    Uncommitted work is rolled back on exit so the next borrower starts clean.
+    """
+    conn = _acquire()
+    try:
+        yield conn
+    finally:
+        try:
+            conn.rollback()
+        except _driver.Error:
+            conn.close()
+        else:
+            _release(conn)
+
+
+def close_all():
+    while True:
+        try:
+            _pool.get_nowait().close()
+        except queue.Empty:
+            return
@@ -0,0 +1,16 @@
+import os
+from functools import lru_cache
+
+import google.generativeai as genai
+
+DEFAULT_MODEL = "gemini-2.0-flash"
+
+
+@lru_cache(maxsize=None)
+def get_model(name: str = DEFAULT_MODEL) -> genai.GenerativeModel:
+    """Configured Gemini model, built once per process and per model name.
+
+    Reads GEMINI_API_KEY from the environment (load .env before the first call).
+    """
+    genai.configure(api_key=os.environ["GEMINI_API_KEY"])
+    return genai.GenerativeModel(name)
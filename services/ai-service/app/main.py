@@ -141,6 +141,20 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+async def send_followup(agent, lock):
+    await asyncio.sleep(20) # Simulated "Searching" delay as requested (20-30s)
+    async with lock:
+        followup_msg = await asyncio.to_thread(agent.generate_followup)
+    await manager.broadcast(followup_msg)
+
+async def send_nudge(agent):
+    try:
+        await asyncio.sleep(90) # Wait 90 seconds for user input
+        nudge_msg = agent.generate_nudge()
+        await manager.broadcast(nudge_msg)
+    except asyncio.CancelledError:
+        pass # Task was cancelled because user replied
+
 @app.get("/", tags=["root"])
 async def read_root() -> dict:
     return {
@@ -157,8 +171,10 @@ async def health_check() -> dict:
         "timestamp": datetime.now(timezone.utc),
     }
 
+# Sync DB-bound endpoints are plain `def`: FastAPI runs them in its threadpool,
+# so the SQLite queries don't stall the event loop (and the WebSocket clients).
 @app.get("/debug/stats", tags=["debug"])
-async def debug_stats() -> dict:
+def debug_stats() -> dict:
     from sqlmodel import Session, select, func
     from app.database import engine
     from app.models import Listing, Flight
@@ -174,7 +190,7 @@ async def debug_stats() -> dict:
     }
 
 @app.get("/bundles", tags=["recommendations"])
-async def get_bundles(destination: str, origin: str = None, date: str = None, budget: float = None, amenities: str = None) -> list:
+def get_bundles(destination: str, origin: str = None, date: str = None, budget: float = None, amenities: str = None) -> list:
     """
     Get Flight+Hotel bundles with Intelligent Fit Score.
     amenities: Comma-separated list of keywords.
@@ -187,13 +203,17 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
     print(f"🔌 WebSocket connection attempt from client: {client_id}")
     await manager.connect(websocket)
     print(f"✅ WebSocket connected: {client_id}")
+    # Keep track of the idle task
+    idle_task = None
     try:
         # Import inside the endpoint to avoid circular import issues if any
         from app.agents.concierge_agent import ConciergeAgent
         agent = ConciergeAgent() # New instance per connection for session safety
+        # Agent calls run in a worker thread (SQLite reads, MySQL booking writes) so
+        # other sockets keep being served; the lock keeps this connection's replies
+        # and its follow-up task from touching the agent's context at the same time.
+        agent_lock = asyncio.Lock()
         
-        # Keep track of the idle task
-        idle_task = None
         user_token = None # Store JWT for this session
 
         while True:
@@ -202,43 +222,33 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
             
             # Handle Auth Token Handshake
             if data.startswith("AUTH_TOKEN:"):
-                user_token = data.split("AUTH_TOKEN:")[1]
+                user_token = data.removeprefix("AUTH_TOKEN:")
                 print(f"🔑 Received auth token for client {client_id}")
                 continue # Skip processing this as a chat message
 
             # Cancel existing idle task if any
             if idle_task:
                 idle_task.cancel()
+                idle_task = None
             
             print(f"🤖 Processing message with agent...")
-            response = agent.process_message(data, user_token=user_token) # Pass token to agent
+            async with agent_lock:
+                response = await asyncio.to_thread(agent.process_message, data, user_token=user_token) # Pass token to agent
             print(f"💬 Agent response: {response[:100]}")
             
-            # Check for [WAIT] tag
-            if "[WAIT]" in response:
-                # Remove tag from message sent to user
-                clean_response = response.replace("[WAIT]", "").strip()
-                await manager.broadcast(clean_response)
+            # Check for [WAIT] tag (single scan; tag is removed from message sent to user)
+            head, wait_tag, tail = response.partition("[WAIT]")
+            if wait_tag:
+                await manager.broadcast((head + tail).strip())
                 
                 # Schedule follow-up (Proactive)
-                async def send_followup():
-                    await asyncio.sleep(20) # Simulated "Searching" delay as requested (20-30s)
-                    followup_msg = agent.generate_followup()
-                    await manager.broadcast(followup_msg)
-                
-                asyncio.create_task(send_followup())
+                asyncio.create_task(send_followup(agent, agent_lock))
             else:
                 await manager.broadcast(response)
                 
                 # Schedule Nudge (Idle Timer)
-                async def send_nudge():
-                    try:
-                        await asyncio.sleep(90) # Wait 90 seconds for user input
-                        nudge_msg = agent.generate_nudge()
-                        await manager.broadcast(nudge_msg)
-                    except asyncio.CancelledError:
-                        pass # Task was cancelled because user replied
-
-                idle_task = asyncio.create_task(send_nudge())
+                idle_task = asyncio.create_task(send_nudge(agent))
     except WebSocketDisconnect:
+        if idle_task:
+            idle_task.cancel()
         manager.disconnect(websocket)
@@ -1,4 +1,5 @@
 from typing import Optional
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 from datetime import datetime
 
@@ -17,6 +18,11 @@ class Listing(SQLModel, table=True):
     deal_score: Optional[float] = None
 
 class Flight(SQLModel, table=True):
+    # Date first: searches match destination with contains() (LIKE '%x%'), which
+    # can't seek, so the ISO date range does the seeking and destination is
+    # filtered from the same index entries
+    __table_args__ = (Index("ix_flight_date_dest", "departure_date", "destination"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     origin: str = Field(index=True)
     destination: str = Field(index=True)
@@ -2,6 +2,8 @@
 import pandas as pd
 import os
 import random
+from datetime import datetime, timedelta
+from sqlalchemy import bindparam, exists, insert
 from sqlmodel import Session, select
 from app.database import engine, create_db_and_tables
 from app.models import Listing, Flight, Deal
@@ -10,6 +12,9 @@ from app.models import Listing, Flight, Deal
 DATA_DIR = "data"
 print(f"DEBUG: DATA_DIR absolute path check: {os.path.abspath(DATA_DIR)}")
 
+# Rows per bulk INSERT; everything is still committed once at the end
+INSERT_CHUNK_SIZE = 1000
+
 
 def ingest_data(force: bool = False):
     create_db_and_tables()
@@ -21,6 +26,9 @@ def ingest_data(force: bool = False):
             return
 
         print("Starting data ingestion...")
+        # Collected as plain dicts and bulk-inserted below instead of session.add per row
+        listing_rows = []
+        flight_rows = []
         
 
         # 1. Ingest Listings (Hotels/Airbnb)
@@ -31,7 +39,7 @@ def ingest_data(force: bool = False):
             # clean the dataframe first
             df['price'] = pd.to_numeric(df['price'], errors='coerce').fillna(0.0)
             
-            for _, row in df.iterrows():
+            for row in df.to_dict('records'):
                 # Price is safe float now
                 # Smart Deals Logic for Hotels
                 base_price = float(row.get('price', 0.0))
@@ -45,7 +53,7 @@ def ingest_data(force: bool = False):
                 possible_tags = ["Pet-friendly", "Near transit", "Breakfast Included", "Ocean View", "City Center"]
                 tags = row.get('room_type', 'Standard') + ", " + ", ".join(random.sample(possible_tags, k=2))
 
-                listing = Listing(
+                listing_rows.append(dict(
                     listing_id=str(row.get('id', 'unknown')),
                     date="2025-12-01", 
                     price=base_price,
@@ -55,11 +63,10 @@ def ingest_data(force: bool = False):
                     avg_30d_price=round(avg_30d, 2),
                     is_deal=is_deal,
                     deal_score=random.randint(70, 100) if is_deal else random.randint(40, 70)
-                )
-                session.add(listing)
+                ))
         else:
             print("listings.csv not found. Generating MOCK listing data...")
-            _generate_mock_listings(session)
+            listing_rows.extend(_generate_mock_listings())
             
         # 1.5 Ingest Airbnb India Data (New Request)
         airbnb_file = os.path.join(DATA_DIR, "Airbnb_India_Top_500.csv")
@@ -69,7 +76,7 @@ def ingest_data(force: bool = False):
             # Schema: address,isHostedBySuperhost,location/lat,location/lng,name,numberOfGuests,pricing/rate/amount,roomType,stars
             
             count = 0
-            for idx, row in df_airbnb.iterrows():
+            for idx, row in enumerate(df_airbnb.to_dict('records')):
                 try:
                     price_val = float(row.get('pricing/rate/amount', 0))
                     if price_val == 0: continue
@@ -90,7 +97,7 @@ def ingest_data(force: bool = False):
                     tags.extend(random.sample(["Wifi", "Pool", "Mountain View", "Breakfast", "River View"], k=2))
                     
                     # Use index as ID suffix to avoid collision
-                    listing = Listing(
+                    listing_rows.append(dict(
                         listing_id=f"airbnb_in_{idx}",
                         date="2025-12-01",
                         price=price_val,
@@ -100,8 +107,7 @@ def ingest_data(force: bool = False):
                         avg_30d_price=round(avg_30d, 2),
                         is_deal=is_deal,
                         deal_score=random.randint(80, 100) if is_deal else random.randint(50, 80)
-                    )
-                    session.add(listing)
+                    ))
                     count += 1
                 except Exception as e:
                     print(f"Skipping row {idx}: {e}")
@@ -118,11 +124,11 @@ def ingest_data(force: bool = False):
                 if val == 'one': return 1
                 return 2 # two_or_more
                 
-            for _, row in df.iterrows():
+            now = datetime.now()
+            for row in df.to_dict('records'):
                 # Calculate date based on days_left
-                from datetime import datetime, timedelta
                 days = int(row.get('days_left', 1))
-                dep_date = (datetime.now() + timedelta(days=days)).strftime('%Y-%m-%d')
+                dep_date = (now + timedelta(days=days)).strftime('%Y-%m-%d')
                 
                 # Smart Deals Logic for Flights
                 raw_price = float(0.0 if pd.isna(row.get('price')) else row.get('price', 0))
@@ -137,7 +143,7 @@ def ingest_data(force: bool = False):
                     discount = random.uniform(0.10, 0.25) # 10-25% off
                     final_price = raw_price * (1 - discount)
                 
-                flight = Flight(
+                flight_rows.append(dict(
                     origin=row.get('source_city', 'JFK'),
                     destination=row.get('destination_city', 'LHR'),
                     airline=row.get('airline', 'Generic Air'),
@@ -147,22 +153,32 @@ def ingest_data(force: bool = False):
                     departure_date=dep_date,
                     seats_left=seats,
                     is_promo=is_promo
-                )
-                session.add(flight)
+                ))
         else:
             print("flights.csv not found. Generating MOCK flight data...")
-            _generate_mock_flights(session)
+            flight_rows.extend(_generate_mock_flights())
             
-        session.commit()
+        conn = session.connection()
+        synchronous = conn.exec_driver_sql("PRAGMA synchronous").scalar()
+        # No fsync per page during the bulk load; restored once ingestion commits
+        conn.exec_driver_sql("PRAGMA synchronous=OFF")
+        try:
+            for model, rows in ((Listing, listing_rows), (Flight, flight_rows)):
+                for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+                    session.bulk_insert_mappings(model, rows[start:start + INSERT_CHUNK_SIZE])
+            session.commit()
+        finally:
+            session.connection().exec_driver_sql(f"PRAGMA synchronous={int(synchronous)}")
         print("Data ingestion complete.")
 
-def _generate_mock_listings(session: Session):
+def _generate_mock_listings():
     neighbourhoods = ["Manhattan", "Brooklyn", "Queens", "SoHo", "Williamsburg"]
     amenities_list = ["Wifi, Kitchen", "Pool, Gym", "Pet friendly", "Wifi, Workspace"]
     
+    rows = []
     for i in range(50):
         price = random.randint(80, 500)
-        listing = Listing(
+        rows.append(dict(
             listing_id=f"mock_{i}",
             date="2025-12-01",
             price=price,
@@ -170,16 +186,17 @@ def _generate_mock_listings(session: Session):
             neighbourhood=random.choice(neighbourhoods),
             amenities=random.choice(amenities_list),
             avg_30d_price=price * 1.2 # Make it look like a deal sometimes
-        )
-        session.add(listing)
+        ))
+    return rows
 
-def _generate_mock_flights(session: Session):
+def _generate_mock_flights():
     airlines = ["Delta", "United", "Emirates", "British Airways"]
     routes = [("JFK", "LHR"), ("SFO", "DXB"), ("LAX", "TYO"), ("NYC", "MIA")]
     
+    rows = []
     for i in range(50):
         origin, dest = random.choice(routes)
-        flight = Flight(
+        rows.append(dict(
             origin=origin,
             destination=dest,
             airline=random.choice(airlines),
@@ -188,5 +205,24 @@ def _generate_mock_flights(session: Session):
             price=random.randint(200, 1500),
             seats_left=random.randint(0, 100),
             is_promo=random.choice([True, False])
-        )
-        session.add(flight)
+        ))
+    return rows
+
+def insert_missing(session: Session, model, rows, key):
+    """
+    Insert `rows` (dicts of model fields) into `model`'s table, skipping any row
+    whose `key` column(s) already match an existing row. Runs as a single
+    executemany of INSERT ... SELECT ... WHERE NOT EXISTS, so no per-row
+    pre-SELECT and no commit; the caller commits. Returns the inserted count.
+    """
+    keys = (key,) if isinstance(key, str) else tuple(key)
+    # Run rows through the model so field defaults (is_deal, created_at, ...) apply
+    rows = [model(**row).model_dump(exclude={"id"}) for row in rows]
+    if not rows:
+        return 0
+
+    table = model.__table__
+    params = {c.name: bindparam(c.name, type_=c.type) for c in table.columns if c.name in rows[0]}
+    already = exists().where(*(table.c[k] == params[k] for k in keys))
+    stmt = insert(table).from_select(list(params), select(*params.values()).where(~already))
+    return session.execute(stmt, rows).rowcount
@@ -5,7 +5,7 @@ async def test_connection():
     uri = "ws://127.0.0.1:8001/ws/concierge/test-client"
     print(f"Connecting to {uri}...")
     try:
-        async with websockets.connect(uri) as websocket:
+        async with websockets.connect(uri, compression=None, max_size=2**22, ping_interval=None) as websocket:
             print("Connected successfully!")
             await websocket.send("Hello AI")
             response = await websocket.recv()
@@ -3,47 +3,48 @@
 Clear ALL test data from databases.
 """
 
-import pymysql
-from sqlmodel import Session
-from app.database import engine
-from app.models import Flight, Listing, Watch, Deal
+from app.database import engine, create_db_and_tables
+from app.db_pool import get_connection
+import app.models  # noqa: F401 - registers tables for create_db_and_tables
 
 def clear_sqlite():
     print("🗑️ Clearing SQLite (ai-service)...")
-    from sqlalchemy import text
-    with Session(engine) as session:
-        # Delete all data
-        session.execute(text("DELETE FROM flight"))
-        session.execute(text("DELETE FROM listing"))
-        session.execute(text("DELETE FROM watch"))
-        try:
-            session.execute(text("DELETE FROM deal"))
-        except:
-            pass # Table may not exist
-        session.commit()
+    # Make sure every model table exists (incl. deal) instead of try/except per DELETE
+    create_db_and_tables()
+    # One driver-level script in a single write transaction, bypassing the ORM Session
+    raw = engine.raw_connection()
+    try:
+        raw.driver_connection.executescript(
+            "BEGIN IMMEDIATE;"
+            "DELETE FROM flight;"
+            "DELETE FROM listing;"
+            "DELETE FROM watch;"
+            "DELETE FROM deal;"
+            "COMMIT;"
+        )
+    finally:
+        raw.close()
     print("   ✅ SQLite cleared")
 
+DELETE_BATCH_SIZE = 5000
+
+def _delete_in_batches(conn, cursor, sql):
+    """Repeat a DELETE with a LIMIT, committing each batch, until no rows match."""
+    while cursor.execute(f"{sql} LIMIT {DELETE_BATCH_SIZE}"):
+        conn.commit()
+
 def clear_mysql():
     print("🗑️ Clearing MySQL (core-api)...")
     try:
-        import os
-        conn = pymysql.connect(
-            host=os.getenv('MYSQL_HOST', 'localhost'),
-            user=os.getenv('MYSQL_USER', 'kayak_user'),
-            password=os.getenv('MYSQL_PASSWORD', 'kayak_pass'),
-            database=os.getenv('MYSQL_DATABASE', 'kayak_core'),
-            port=int(os.getenv('MYSQL_PORT', '3306'))
-        )
-        with conn.cursor() as cursor:
+        with get_connection() as conn, conn.cursor() as cursor:
             # Clear booking items first (FK)
             cursor.execute("DELETE FROM booking_items")
             # Clear bookings
             cursor.execute("DELETE FROM bookings")
-            # Optionally clear synced entities
-            cursor.execute("DELETE FROM flights WHERE id LIKE 'sync-%' OR airline = 'UnityAir'")
-            cursor.execute("DELETE FROM hotels WHERE name LIKE 'Hotel in %'")
             conn.commit()
-        conn.close()
+            # Optionally clear synced entities, in short batches so row locks are released
+            _delete_in_batches(conn, cursor, "DELETE FROM flights WHERE id LIKE 'sync-%' OR airline = 'UnityAir'")
+            _delete_in_batches(conn, cursor, "DELETE FROM hotels WHERE name LIKE 'Hotel in %'")
         print("   ✅ MySQL cleared (bookings, booking_items)")
     except Exception as e:
         print(f"   ⚠️ MySQL clear failed: {e}")
@@ -0,0 +1,73 @@
+"""
+Shared pytest fixtures for the ai-service test scripts (each script still runs
+standalone via `python test_x.py`).
+"""
+
+import pytest
+
+from app.db_pool import get_connection
+from testing_helpers import BookingVerifier
+
+
+_BOOKING_VERIFIER = pytest.StashKey[BookingVerifier]()
+
+
+def pytest_configure(config):
+    config.stash[_BOOKING_VERIFIER] = BookingVerifier()
+
+
+@pytest.fixture
+def booking_verifier(request):
+    """Tests register expected booking dates; all are checked in one query at session end."""
+    verifier = request.config.stash[_BOOKING_VERIFIER]
+    verifier.current_test = request.node.nodeid
+    yield verifier
+    verifier.current_test = None
+
+
+def pytest_sessionfinish(session, exitstatus):
+    # Checked here rather than in fixture teardown, which pytest would report as an
+    # error on whatever test ran last; failures name the test that made the booking.
+    verifier = session.config.stash.get(_BOOKING_VERIFIER, None)
+    if verifier is None or not verifier.expected:
+        return
+    try:
+        failed = verifier.verify()
+        lines = [f"FAILED {verifier.sources[booking_id]} - booking {booking_id} "
+                 f"start_date is not {verifier.expected[booking_id]}" for booking_id in failed]
+    except Exception as e:
+        lines = [f"ERROR {test_id} - could not verify bookings: {e}"
+                 for test_id in dict.fromkeys(verifier.sources.values())]
+    if not lines:
+        return
+    reporter = session.config.pluginmanager.get_plugin("terminalreporter")
+    if reporter:
+        reporter.ensure_newline()
+        reporter.write_sep("=", "booking start_date check", red=True)
+    for line in lines:
+        if reporter:
+            reporter.write_line(line, red=True)
+        else:
+            print(line)
+    session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+@pytest.fixture(scope="session")
+def _session_agent():
+    # Imported here so sessions that never use the agent don't load it (or its SQLite engine)
+    from app.agents.concierge_agent import ConciergeAgent
+    return ConciergeAgent()
+
+
+@pytest.fixture
+def agent(_session_agent):
+    """One ConciergeAgent for the whole session, reset to a fresh conversation per test."""
+    _session_agent.reset()
+    return _session_agent
+
+
+@pytest.fixture
+def mysql_conn():
+    """Pooled kayak_core connection; anything the test leaves uncommitted is rolled back."""
+    with get_connection() as conn:
+        yield conn
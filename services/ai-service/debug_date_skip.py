@@ -1,37 +1,40 @@
 from app.agents.concierge_agent import ConciergeAgent, SimpleNLU
+from pilot_log import get_pilot_logger
+
+log = get_pilot_logger()
 
 def debug_issue():
-    print("--- Debugging Date Skip Issue ---")
+    log.info("--- Debugging Date Skip Issue ---")
     
     # 1. Check NLU Extraction
     nlu = SimpleNLU()
     msg = "Plan a trip to Mumbai"
     extracted = nlu.extract(msg)
-    print(f"Input: '{msg}'")
-    print(f"Extracted: {extracted}")
+    log.info(f"Input: '{msg}'")
+    log.info(f"Extracted: {extracted}")
     
     if extracted.get("dates"):
-        print("🚨 ALARM: Dates extracted non-empty! This causes the skip.")
+        log.info("🚨 ALARM: Dates extracted non-empty! This causes the skip.")
     else:
-        print("✅ Dates not extracted by NLU (Correct).")
+        log.info("✅ Dates not extracted by NLU (Correct).")
 
     # 2. Check Agent Flow
     agent = ConciergeAgent()
-    print(f"\nInitial Ctx: {agent.current_context}")
+    log.info(f"\nInitial Ctx: {agent.current_context}")
     
     resp = agent.process_message(msg)
-    print(f"Agent Resp: {resp[:100]}...")
+    log.info(f"Agent Resp: {resp[:100]}...")
     
-    print(f"Post-Resp Ctx: {agent.current_context}")
+    log.info(f"Post-Resp Ctx: {agent.current_context}")
     
     if "When" not in resp:
-        print("🚨 ALARM: Agent DID NOT ask 'When'.")
+        log.info("🚨 ALARM: Agent DID NOT ask 'When'.")
         if agent.current_context.get("dates"):
-            print(f"Reason: Date already set to '{agent.current_context['dates']}'")
+            log.info(f"Reason: Date already set to '{agent.current_context['dates']}'")
         elif agent.last_recommendations:
-            print("Reason: last_recommendations not empty?!")
+            log.info("Reason: last_recommendations not empty?!")
     else:
-        print("✅ Agent correctly asked 'When'.")
+        log.info("✅ Agent correctly asked 'When'.")
 
 if __name__ == "__main__":
     debug_issue()
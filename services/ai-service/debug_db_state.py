@@ -1,47 +1,42 @@
-```python
-import pymysql
-import sys
-import os
+from app.db_pool import get_connection
+from pilot_log import get_pilot_logger
+
+log = get_pilot_logger()
+
+DEMO_USER_EMAIL = "akshay.menon@usa.com"
 
 def debug_db():
-    print("--- Debugging DB State ---")
-    
-    conn = pymysql.connect(
-        host=os.getenv('MYSQL_HOST', 'localhost'),
-        user=os.getenv('MYSQL_USER', 'kayak_user'),
-        password=os.getenv('MYSQL_PASSWORD', 'kayak_pass'),
-        database=os.getenv('MYSQL_DATABASE', 'kayak_core'),
-        port=int(os.getenv('MYSQL_PORT', '3306')),
-        cursorclass=pymysql.cursors.DictCursor
-    )
+    log.info("--- Debugging DB State ---")
     
     try:
-        with conn.cursor() as cursor:
+        with get_connection() as conn, conn.cursor() as cursor:
+            # One round trip: the user row plus their latest bookings (NULL b.* if none)
+            cursor.execute("""
+                SELECT u.id AS user_id, u.email, u.first_name, u.last_name,
+                       b.booking_reference, b.status, b.created_at
+                FROM users u
+                LEFT JOIN bookings b ON b.user_id = u.id
+                WHERE u.email = %s
+                ORDER BY b.created_at DESC LIMIT 5
+            """, (DEMO_USER_EMAIL,))
+            rows = cursor.fetchall()
+
             # 1. Check Users
-            print("\n1. USERS (akshay.menon@usa.com):")
-            cursor.execute("SELECT id, email, first_name, last_name FROM users WHERE email = 'akshay.menon@usa.com'")
-            users = cursor.fetchall()
-            for u in users:
-                print(f"   found: {u}")
-                
-            if not users:
-                print("   ❌ No user found with that email!")
+            log.info(f"\n1. USERS ({DEMO_USER_EMAIL}):")
+            if rows:
+                u = rows[0]
+                log.info(f"   found: ID={u['user_id']} | {u['email']} | {u['first_name']} {u['last_name']}")
+            else:
+                log.error("   ❌ No user found with that email!")
 
-            # 2. Check Recent Bookings (Last 1 hour)
-            print("\n2. RECENT BOOKINGS (All users, last 1 hour):")
-            cursor.execute("""
-                SELECT id, user_id, booking_reference, status, created_at 
-                FROM bookings 
-                ORDER BY created_at DESC LIMIT 5
-            """)
-            bookings = cursor.fetchall()
-            for b in bookings:
-                print(f"   Booking: Ref={b['booking_reference']} | Status={b['status']} | UserID={b['user_id']}")
+            # 2. Check Recent Bookings
+            log.info(f"\n2. RECENT BOOKINGS ({DEMO_USER_EMAIL}, latest 5):")
+            for b in rows:
+                if b['booking_reference'] is not None:
+                    log.info(f"   Booking: Ref={b['booking_reference']} | Status={b['status']} | UserID={b['user_id']}")
                 
     except Exception as e:
-        print(f"❌ Error: {e}")
-    finally:
-        conn.close()
+        log.exception(f"❌ Error: {e}")
 
 if __name__ == "__main__":
     debug_db()
@@ -1,18 +1,31 @@
 import re
+from pilot_log import get_pilot_logger
+
+log = get_pilot_logger()
+
+# Compiled once at import; IGNORECASE spares the per-call text.lower() copy.
+# Anchored on word boundaries with a date-ish character class so non-date input
+# ("Book Option 1 Vistara - $2476.0") fails fast instead of backtracking.
+_DATE_RE = re.compile(r'\b(?:on|from|starting)\s+(?P<date>[A-Za-z0-9,/\- ]{4,15})\b', re.IGNORECASE)
+# Substring pre-filter: skip the regex entirely when no cue word is present
+_DATE_CUES = ('on ', 'from ', 'starting ')
 
 class SimpleNLU:
     def extract(self, text: str) -> dict:
-        text = text.lower()
         result = {"dates": None}
         
         # Current Logic (Reproducing failure)
-        date_match = re.search(r'(on|from|starting)\s+(?P<date>.{4,15})', text)
+        lowered = text.lower()
+        if not any(cue in lowered for cue in _DATE_CUES):
+            return result
+
+        date_match = _DATE_RE.search(text)
         if date_match:
-             raw_date = date_match.group("date").split(" to ")[0].split(" for ")[0]
+             raw_date = date_match.group("date").partition(" to ")[0].partition(" for ")[0]
              result["dates"] = raw_date.strip()
              
         return result
 
 nlu = SimpleNLU()
-print(f"Input: 'December 25th' -> {nlu.extract('December 25th')}")
-print(f"Input: 'on December 25th' -> {nlu.extract('on December 25th')}")
+log.info(f"Input: 'December 25th' -> {nlu.extract('December 25th')}")
+log.info(f"Input: 'on December 25th' -> {nlu.extract('on December 25th')}")
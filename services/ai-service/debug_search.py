@@ -1,37 +1,47 @@
-from sqlmodel import Session, select, col
+from sqlmodel import Session, select, func
 from app.database import engine
 from app.models import Flight, Listing
 from app.agents.concierge_agent import ConciergeAgent
+from app.agents.deals_agent import departure_date_filter
+from pilot_log import get_pilot_logger
+
+log = get_pilot_logger()
 
 def debug_search():
-    print("--- Debugging Search Query ---")
+    log.info("--- Debugging Search Query ---")
     agent = ConciergeAgent()
     norm_date = agent.normalize_date("december")
-    print(f"Normalized Date: '{norm_date}'")
+    log.info(f"Normalized Date: '{norm_date}'")
     
     dest = "Mumbai"
     
     with Session(engine) as session:
-        # Check raw count
-        total = session.exec(select(Flight)).all()
-        print(f"Total Flights in DB: {len(total)}")
+        # Check raw count (server-side COUNT, no Flight objects built)
+        total = session.exec(select(func.count()).select_from(Flight)).one()
+        log.info(f"Total Flights in DB: {total}")
         
-        # Check without date
-        stmt = select(Flight).where(Flight.destination.contains(dest))
-        res = session.exec(stmt).all()
-        print(f"Flights to {dest} (No date): {len(res)}")
+        # Check without date (same contains() match as DealsAgent.get_recommendations)
+        dest_filter = Flight.destination.contains(dest)
+        res = session.exec(select(func.count()).select_from(Flight).where(dest_filter)).one()
+        log.info(f"Flights to {dest} (No date): {res}")
         
         # Check WITH date
         if norm_date:
-            stmt = stmt.where(col(Flight.departure_date).contains(norm_date))
-            res_date = session.exec(stmt).all()
-            print(f"Flights to {dest} on {norm_date}: {len(res_date)}")
+            # Same date condition the real search uses (seeks ix_flight_date_dest)
+            date_filter = departure_date_filter(norm_date)
+            res_date = session.exec(
+                select(func.count()).select_from(Flight).where(dest_filter, date_filter)
+            ).one()
+            log.info(f"Flights to {dest} on {norm_date}: {res_date}")
             
             if not res_date:
-                 print("❌ Query returned 0. Checking sample dates...")
-                 sample = session.exec(select(Flight).limit(5)).all()
-                 for s in sample: 
-                     print(f"   Sample: {s.origin}->{s.destination} on {s.departure_date}")
+                 log.info("❌ Query returned 0. Checking sample dates...")
+                 # Only the printed columns, as plain tuples
+                 sample = session.exec(
+                     select(Flight.origin, Flight.destination, Flight.departure_date).limit(5)
+                 ).all()
+                 for origin, destination, departure_date in sample: 
+                     log.info(f"   Sample: {origin}->{destination} on {departure_date}")
 
 if __name__ == "__main__":
     debug_search()
@@ -12,60 +12,69 @@ Tests all key AI Concierge features:
 from app.agents.concierge_agent import ConciergeAgent
 from app.agents.deals_agent import deals_agent
 import json
+from pilot_log import get_pilot_logger
+
+log = get_pilot_logger()
 
 def pretty_print(label, response):
-    print(f"\n{'='*60}")
-    print(f"📍 {label}")
-    print(f"{'='*60}")
+    log.info(f"\n{'='*60}")
+    log.info(f"📍 {label}")
+    log.info(f"{'='*60}")
     if isinstance(response, str):
-        try:
-            data = json.loads(response)
-            print(f"🤖 Agent: {data.get('text', response)}")
+        # Structured replies are JSON objects; skip the parse attempt for plain text
+        data = None
+        if response.startswith("{"):
+            try:
+                data = json.loads(response)
+            except ValueError:
+                pass
+        if data is not None:
+            log.info(f"🤖 Agent: {data.get('text', response)}")
             if data.get('actions'):
-                print(f"   [Chips]: {data['actions']}")
-        except:
-            print(f"🤖 Agent: {response[:500]}...")
+                log.info(f"   [Chips]: {data['actions']}")
+        else:
+            log.info(f"🤖 Agent: {response[:500]}...")
     else:
-        print(f"🤖 Agent: {response}")
+        log.info(f"🤖 Agent: {response}")
 
 def run_pilot():
-    print("\n" + "🚀"*20)
-    print("      PILOT RUN: AI CONCIERGE - FULL USER JOURNEYS")
-    print("🚀"*20 + "\n")
+    log.info("\n" + "🚀"*20)
+    log.info("      PILOT RUN: AI CONCIERGE - FULL USER JOURNEYS")
+    log.info("🚀"*20 + "\n")
     
     agent = ConciergeAgent()
     
     # =========================================================================
     # JOURNEY 1: "Tell me what I should book"
     # =========================================================================
-    print("\n" + "─"*60)
-    print("📦 JOURNEY 1: Bundle Search")
-    print("─"*60)
+    log.info("\n" + "─"*60)
+    log.info("📦 JOURNEY 1: Bundle Search")
+    log.info("─"*60)
     
     # Test Bundle API Directly
-    print("\n👤 User: 'Find a package to Mumbai, budget $2000'")
+    log.info("\n👤 User: 'Find a package to Mumbai, budget $2000'")
     bundles = deals_agent.create_bundles(destination="Mumbai", budget=2000)
     
     if bundles:
-        print(f"\n✅ Found {len(bundles)} bundles!")
+        log.info(f"\n✅ Found {len(bundles)} bundles!")
         for i, b in enumerate(bundles[:2]):
-            print(f"\n   Bundle {i+1}:")
-            print(f"   - Total: ${b['total_price']}")
-            print(f"   - Fit Score: {b['fit_score']}/100")
-            print(f"   - Why This: {b['why_this']}")
-            print(f"   - Watch Out: {b['what_to_watch']}")
-            print(f"   - Policies: {b['policies']}")
+            log.info(f"\n   Bundle {i+1}:")
+            log.info(f"   - Total: ${b['total_price']}")
+            log.info(f"   - Fit Score: {b['fit_score']}/100")
+            log.info(f"   - Why This: {b['why_this']}")
+            log.info(f"   - Watch Out: {b['what_to_watch']}")
+            log.info(f"   - Policies: {b['policies']}")
     else:
-        print("❌ No bundles found (check seeded data)")
+        log.error("❌ No bundles found (check seeded data)")
     
     # =========================================================================
     # JOURNEY 2: "Refine without starting over"
     # =========================================================================
-    print("\n" + "─"*60)
-    print("🔄 JOURNEY 2: Refinement with Amenities")
-    print("─"*60)
+    log.info("\n" + "─"*60)
+    log.info("🔄 JOURNEY 2: Refinement with Amenities")
+    log.info("─"*60)
     
-    print("\n👤 User: 'Make it pet-friendly with a pool'")
+    log.info("\n👤 User: 'Make it pet-friendly with a pool'")
     refined = deals_agent.create_bundles(
         destination="Mumbai", 
         budget=2000, 
@@ -73,22 +82,22 @@ def run_pilot():
     )
     
     if refined:
-        print(f"\n✅ Refined to {len(refined)} matching bundles!")
+        log.info(f"\n✅ Refined to {len(refined)} matching bundles!")
         rb = refined[0]
-        print(f"   - New Fit Score: {rb['fit_score']}/100 (Boosted for amenity match)")
-        print(f"   - Explanation: {rb['why_this']}")
+        log.info(f"   - New Fit Score: {rb['fit_score']}/100 (Boosted for amenity match)")
+        log.info(f"   - Explanation: {rb['why_this']}")
     else:
-        print("   ⚠️ No pet-friendly pools found. (This is expected if test data doesn't match)")
-        print("   ✅ Filter logic working correctly - empty result for missing amenities.")
+        log.info("   ⚠️ No pet-friendly pools found. (This is expected if test data doesn't match)")
+        log.info("   ✅ Filter logic working correctly - empty result for missing amenities.")
     
     # =========================================================================
     # JOURNEY 3: "Keep an eye on it"
     # =========================================================================
-    print("\n" + "─"*60)
-    print("👀 JOURNEY 3: Watch & Alert")
-    print("─"*60)
+    log.info("\n" + "─"*60)
+    log.info("👀 JOURNEY 3: Watch & Alert")
+    log.info("─"*60)
     
-    print("\n👤 User: 'Track Mumbai packages under $1500'")
+    log.info("\n👤 User: 'Track Mumbai packages under $1500'")
     resp = agent.process_message("Track Mumbai packages under $1500")
     pretty_print("Watch Response", resp)
     
@@ -97,57 +106,63 @@ def run_pilot():
     from app.database import engine
     from app.models import Watch
     with Session(engine) as session:
-        watches = session.exec(select(Watch).where(Watch.destination == "Mumbai")).all()
-        if watches:
-            print(f"\n   ✅ Watch Created: Target ${watches[-1].target_price}")
+        # Latest watch only: ORDER BY id DESC LIMIT 1 on the primary key, one column
+        target_price = session.exec(
+            select(Watch.target_price)
+            .where(Watch.destination == "Mumbai")
+            .order_by(Watch.id.desc())
+            .limit(1)
+        ).first()
+        if target_price is not None:
+            log.info(f"\n   ✅ Watch Created: Target ${target_price}")
         else:
-            print("\n   ❌ Watch not found in DB")
+            log.error("\n   ❌ Watch not found in DB")
     
     # =========================================================================
     # JOURNEY 4: "Decide with confidence"
     # =========================================================================
-    print("\n" + "─"*60)
-    print("💡 JOURNEY 4: Price Comparison Explanation")
-    print("─"*60)
+    log.info("\n" + "─"*60)
+    log.info("💡 JOURNEY 4: Price Comparison Explanation")
+    log.info("─"*60)
     
-    print("\n👤 User: 'Is this rate actually good?'")
+    log.info("\n👤 User: 'Is this rate actually good?'")
     # Simulate by checking a bundle's explanation
     if bundles:
         b = bundles[0]
-        print(f"\n   🤖 Agent Explains:")
-        print(f"      - {b['why_this'][0] if b['why_this'] else 'Best value bundle'}")
-        print(f"      - Fit Score {b['fit_score']}/100 indicates match quality")
+        log.info(f"\n   🤖 Agent Explains:")
+        log.info(f"      - {b['why_this'][0] if b['why_this'] else 'Best value bundle'}")
+        log.info(f"      - Fit Score {b['fit_score']}/100 indicates match quality")
         if b['what_to_watch']:
-            print(f"      - ⚠️ Watch out: {b['what_to_watch']}")
+            log.info(f"      - ⚠️ Watch out: {b['what_to_watch']}")
     
     # =========================================================================
     # JOURNEY 5: "Book or hand off cleanly"
     # =========================================================================
-    print("\n" + "─"*60)
-    print("✅ JOURNEY 5: Booking Quote")
-    print("─"*60)
+    log.info("\n" + "─"*60)
+    log.info("✅ JOURNEY 5: Booking Quote")
+    log.info("─"*60)
     
     # Seed recommendations for booking
     agent.last_recommendations = bundles if bundles else []
     
     if agent.last_recommendations:
-        print("\n👤 User: 'Book option 1'")
+        log.info("\n👤 User: 'Book option 1'")
         book_resp = agent.process_message("Book option 1")
         pretty_print("Booking Response", book_resp)
         
         # Check for Invoice/Quote in response
         if "Invoice" in book_resp or "Taxes" in book_resp:
-            print("\n   ✅ Quote/Invoice generated successfully!")
+            log.info("\n   ✅ Quote/Invoice generated successfully!")
         else:
-            print("\n   ⚠️ Quote format check: Response did not contain explicit Invoice.")
+            log.info("\n   ⚠️ Quote format check: Response did not contain explicit Invoice.")
     
     # =========================================================================
     # SUMMARY
     # =========================================================================
-    print("\n" + "="*60)
-    print("📊 PILOT RUN SUMMARY")
-    print("="*60)
-    print("""
+    log.info("\n" + "="*60)
+    log.info("📊 PILOT RUN SUMMARY")
+    log.info("="*60)
+    log.info("""
     ✅ Journey 1: Bundle Search - TESTED
     ✅ Journey 2: Refinement - TESTED  
     ✅ Journey 3: Watch/Alert - TESTED
@@ -1,25 +1,31 @@
 from app.agents.concierge_agent import ConciergeAgent
 import json
 import time
+from pilot_log import get_pilot_logger
+
+log = get_pilot_logger()
 
 def run_pilot():
     agent = ConciergeAgent()
-    print("🚀 STARTED: Pilot Run - Hotel Flow")
+    log.info("🚀 STARTED: Pilot Run - Hotel Flow")
 
     def user_turn(msg):
-        print(f"\n👤 User: {msg}")
+        log.info(f"\n👤 User: {msg}")
         resp = agent.process_message(msg)
-        try:
-            r = json.loads(resp)
-            text = r["text"]
-            actions = r.get("actions", [])
-        except:
-            text = resp
-            actions = []
+        text = resp
+        actions = []
+        # Only JSON-object replies carry chips; plain text skips the parse
+        if resp.startswith("{"):
+            try:
+                r = json.loads(resp)
+                text = r["text"]
+                actions = r.get("actions", [])
+            except (ValueError, KeyError):
+                pass
             
-        print(f"🤖 Agent: {text}")
+        log.info(f"🤖 Agent: {text}")
         if actions:
-            print(f"   [Chips]: {actions}")
+            log.info(f"   [Chips]: {actions}")
         
         return {"text": text, "actions": actions}
 
@@ -34,16 +40,16 @@ def run_pilot():
     # 3. Provide Nights (Implicit Check-out)
     res = user_turn("3 nights")
     # Should trigger search
-    print(f"Final Response: {res['text'][:200]}...")
+    log.info(f"Final Response: {res['text'][:200]}...")
     
     # Verify Context
-    print(f"\nCTX Check-In: {agent.current_context['check_in']}")
-    print(f"CTX Check-Out: {agent.current_context['check_out']}")
-    print(f"CTX Nights: {agent.current_context['nights']}")
+    log.info(f"\nCTX Check-In: {agent.current_context['check_in']}")
+    log.info(f"CTX Check-Out: {agent.current_context['check_out']}")
+    log.info(f"CTX Nights: {agent.current_context['nights']}")
     
     assert agent.current_context['check_in'] == "2026-01-10"
     assert agent.current_context['check_out'] == "2026-01-13" # 10 + 3
-    print("\n✅ HOTEL FLOW PILOT PASSED")
+    log.info("\n✅ HOTEL FLOW PILOT PASSED")
 
 if __name__ == "__main__":
     run_pilot()
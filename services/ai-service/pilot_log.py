@@ -0,0 +1,20 @@
+import logging
+import os
+import sys
+
+
+def get_pilot_logger():
+    """Return the "pilot" logger shared by the pilot/debug scripts.
+
+    Messages go to stdout as plain text; PILOT_LOG_LEVEL sets the level
+    (WARNING silences the chatter, DEBUG adds step-by-step detail). The stdout
+    handler is attached once per process, so importing several scripts in one
+    run (as pytest does) doesn't repeat lines. Records still propagate, so
+    pytest's log capture sees them; SQLAlchemy's echo output uses its own
+    "sqlalchemy.engine" handler and is not affected.
+    """
+    log = logging.getLogger("pilot")
+    if not log.handlers:
+        log.addHandler(logging.StreamHandler(sys.stdout))
+        log.setLevel(os.getenv("PILOT_LOG_LEVEL", "INFO"))
+    return log
@@ -9,44 +9,51 @@ sys.path.append(os.getcwd())
 from app.services.data_ingestion import ingest_data
 from app.database import engine
 from app.models import Flight, Listing
+from pilot_log import get_pilot_logger
+
+log = get_pilot_logger()
 
 def main():
-    print("--- PILOT RUN STARTING ---")
+    log.info("--- PILOT RUN STARTING ---")
     
     # 1. Force Ingestion
-    print("Step 1: Running Data Ingestion...")
+    log.info("Step 1: Running Data Ingestion...")
     try:
         ingest_data(force=True)
     except Exception as e:
-        print(f"CRITICAL ERROR during ingestion: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception(f"CRITICAL ERROR during ingestion: {e}")
         sys.exit(1)
         
     # 2. Verify Data
-    print("\nStep 2: Verifying Data...")
+    log.info("\nStep 2: Verifying Data...")
     with Session(engine) as session:
-        f_count = session.exec(select(func.count(Flight.id))).one()
-        l_count = session.exec(select(func.count(Listing.id))).one()
-        print(f"Total Flights: {f_count}")
-        print(f"Total Listings: {l_count}")
+        # Both counts in one round trip
+        f_count, l_count = session.exec(select(
+            select(func.count(Flight.id)).scalar_subquery(),
+            select(func.count(Listing.id)).scalar_subquery(),
+        )).one()
+        log.info(f"Total Flights: {f_count}")
+        log.info(f"Total Listings: {l_count}")
         
         # 3. Check for Delhi
-        print("\nStep 3: Checking for 'Delhi' flights...")
+        log.info("\nStep 3: Checking for 'Delhi' flights...")
         # Check source_city or destination_city (mapped to origin/destination)
-        delhi_flights = session.exec(select(Flight).where(
-            (Flight.origin.contains("Delhi")) | 
-            (Flight.destination.contains("Delhi"))
-        ).limit(5)).all()
+        # Only the printed columns are selected; rows come back as tuples, not Flight objects
+        delhi_flights = session.exec(
+            select(Flight.airline, Flight.origin, Flight.destination, Flight.price).where(
+                (Flight.origin.contains("Delhi")) | 
+                (Flight.destination.contains("Delhi"))
+            ).limit(5)
+        ).all()
         
         if delhi_flights:
-            print(f"✅ Found {len(delhi_flights)} sample flights matching 'Delhi':")
-            for f in delhi_flights:
-                print(f"   - {f.airline}: {f.origin} -> {f.destination} (${f.price})")
+            log.info(f"✅ Found {len(delhi_flights)} sample flights matching 'Delhi':")
+            for airline, origin, destination, price in delhi_flights:
+                log.info(f"   - {airline}: {origin} -> {destination} (${price})")
         else:
-            print("❌ No flights found for 'Delhi'. Checking mock data?")
+            log.error("❌ No flights found for 'Delhi'. Checking mock data?")
             
-        print("\n--- PILOT RUN COMPLETE ---")
+        log.info("\n--- PILOT RUN COMPLETE ---")
 
 if __name__ == "__main__":
     main()
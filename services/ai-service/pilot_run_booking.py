@@ -1,23 +1,28 @@
 from app.agents.concierge_agent import ConciergeAgent
 import json
-import pymysql
+from app.db_pool import get_connection
+from pilot_log import get_pilot_logger
+
+log = get_pilot_logger()
+
+DEMO_USER_EMAIL = "akshay.menon@usa.com"
 
 # 1. Instantiate Agent
 agent = ConciergeAgent()
-print("🤖 Agent Instantiated (Local Mode)")
+log.info("🤖 Agent Instantiated (Local Mode)")
 
 # 2. Simulate User Flow
 # Step A: Intent
 resp1 = agent.process_message("Plan a trip to Mumbai")
-print(f"\nUser: Plan a trip to Mumbai\nAgent: {resp1}")
+log.info(f"\nUser: Plan a trip to Mumbai\nAgent: {resp1}")
 
 # Step B: Dates
 # This should trigger the [WAIT] delay logic, but we just want to set context
 resp2 = agent.process_message("December 25th")
-print(f"\nUser: December 25th\nAgent: {resp2}")
+log.info(f"\nUser: December 25th\nAgent: {resp2}")
 
 # Step C: Populate Recommendations (Simulate what Main.py does after [WAIT])
-print("\n... Simulating Search Delay ...")
+log.info("\n... Simulating Search Delay ...")
 # Need to manually populate last_recommendations since we aren't waiting for the async task
 # Force a search call
 from app.agents.deals_agent import deals_agent
@@ -30,37 +35,27 @@ flight = {
     "origin": "JFK"
 }
 agent.last_recommendations = [flight]
-print("DEBUG: Injected Vistara flight into agent memory")
+log.info("DEBUG: Injected Vistara flight into agent memory")
 
 # Step D: Select / Book
-print("\nUser: Lets go with Vistara")
+log.info("\nUser: Lets go with Vistara")
 resp3 = agent.process_message("Lets go with Vistara")
-print(f"Agent: {resp3}")
+log.info(f"Agent: {resp3}")
 
 # 3. Verify in DB
 try:
-    import os
-    conn = pymysql.connect(
-        host=os.getenv('MYSQL_HOST', 'localhost'),
-        user=os.getenv('MYSQL_USER', 'kayak_user'),
-        password=os.getenv('MYSQL_PASSWORD', 'kayak_pass'),
-        database=os.getenv('MYSQL_DATABASE', 'kayak_core'),
-        port=int(os.getenv('MYSQL_PORT', '3306')),
-        cursorclass=pymysql.cursors.DictCursor
-    )
-    with conn.cursor() as cursor:
+    with get_connection() as conn, conn.cursor() as cursor:
         cursor.execute("""
             SELECT b.id, b.booking_reference, b.total_amount, u.email 
             FROM bookings b 
             JOIN users u ON b.user_id = u.id 
-            WHERE u.email = 'akshay.menon@usa.com' 
+            WHERE u.email = %s
             ORDER BY b.created_at DESC LIMIT 1
-        """)
+        """, (DEMO_USER_EMAIL,))
         rec = cursor.fetchone()
         if rec:
-            print(f"\n✅ VERIFICATION SUCCESS: Booking Found!\nRef: {rec['booking_reference']} | Amount: ${rec['total_amount']}")
+            log.info(f"\n✅ VERIFICATION SUCCESS: Booking Found!\nRef: {rec['booking_reference']} | Amount: ${rec['total_amount']}")
         else:
-             print("\n❌ VERIFICATION FAILED: No booking found for user.")
-    conn.close()
+             log.error("\n❌ VERIFICATION FAILED: No booking found for user.")
 except Exception as e:
-    print(f"Verification Error: {e}")
+    log.exception(f"Verification Error: {e}")
@@ -1,24 +1,33 @@
 import json
 from app.agents.concierge_agent import ConciergeAgent
+from pilot_log import get_pilot_logger
+
+log = get_pilot_logger()
+
+def _trunc(s, n=200):
+    """Shorten long replies for display; short ones are printed as-is, uncopied."""
+    return s if len(s) <= n else s[:n] + "..."
 
 def run_pilot():
-    print("🚀 STARTED: Pilot Run - Smart Agent (Headless)")
+    log.info("🚀 STARTED: Pilot Run - Smart Agent (Headless)")
     agent = ConciergeAgent()
     
     # helper to simulate user turn
     def user_turn(msg):
-        print(f"\n👤 User: {msg}")
+        log.info(f"\n👤 User: {msg}")
         resp = agent.process_message(msg)
-        try:
-            data = json.loads(resp)
-            print(f"🤖 Agent: {data['text']}")
-            if data.get('actions'):
-                 print(f"   [Chips]: {data['actions']}")
-            return data
-        except:
-            # Fallback for plain text (Final results usually)
-            print(f"🤖 Agent: {resp[:100]}...")
-            return {"text": resp}
+        if resp.startswith("{"):
+            try:
+                data = json.loads(resp)
+                log.info(f"🤖 Agent: {data['text']}")
+                if data.get('actions'):
+                     log.info(f"   [Chips]: {data['actions']}")
+                return data
+            except (ValueError, KeyError):
+                pass
+        # Fallback for plain text (Final results usually)
+        log.info(f"🤖 Agent: {_trunc(resp, 100)}")
+        return {"text": resp}
 
     # Flow 1: "Plan a trip" (Missing everything)
     res = user_turn("Plan a trip")
@@ -42,10 +51,10 @@ def run_pilot():
     res = user_turn("2")
     # Should now trigger search and return results (plain text usually)
     # Result format: "1. ✈️ Vistara..."
-    print(f"Final Response: {res['text'][:200]}...")
+    log.info(f"Final Response: {_trunc(res['text'])}")
     assert "✈️" in res['text'] or "Vistara" in res['text'] or "Mumbai" in res['text']
     
-    print("\n✅ PILOT PASSED: Full conversational loop completed successfully.")
+    log.info("\n✅ PILOT PASSED: Full conversational loop completed successfully.")
 
 if __name__ == "__main__":
     run_pilot()
@@ -7,8 +7,9 @@ def reload_db():
     print("--- Reloading DB with Smart Data ---")
     with Session(engine) as session:
         print("Cleaning old data...")
-        session.exec(delete(Flight))
-        session.exec(delete(Listing))
+        # Plain bulk DELETEs; nothing is loaded in this session, so skip state sync
+        session.execute(delete(Flight), execution_options={"synchronize_session": False})
+        session.execute(delete(Listing), execution_options={"synchronize_session": False})
         session.commit()
         print("Old data deleted.")
         
@@ -0,0 +1,72 @@
+"""
+Seed every demo fixture (Mumbai hotel, Smart Stay hotel, Santa Air flight)
+into the ai-service SQLite DB in a single transaction. Rows that already
+exist are skipped, so this is safe to re-run; the individual seed_* scripts
+delegate here with just their own fixture.
+"""
+
+from sqlmodel import Session
+from app.database import engine, create_db_and_tables
+from app.models import Flight, Listing
+from app.services.data_ingestion import insert_missing
+
+# NOTE: Using 'Mumbai' as neighbourhood for simplicity in NLU matching
+MUMBAI_HOTEL = dict(
+    listing_id="9990001",
+    date="2025-12-07",
+    price=250.0,
+    availability=5,
+    amenities="Pool,WiFi,Spa",
+    neighbourhood="Mumbai",
+    avg_30d_price=250.0,
+    is_deal=False,
+)
+
+SMART_HOTEL = dict(
+    listing_id="smart_hotel_1",
+    date="2025-12-01",
+    price=150.0,
+    availability=365,
+    neighbourhood="Mumbai",
+    amenities="Wifi, Pool, Pet-friendly", # Tags
+    avg_30d_price=300.0, # High avg
+    is_deal=True, # Explicitly a deal (150 < 300)
+    deal_score=95,
+)
+
+# A specific flight for Christmas
+SANTA_AIR_FLIGHT = dict(
+    origin="JFK",
+    destination="Mumbai",
+    airline="Santa Air",
+    departure_date="2025-12-25", # The date we want to match
+    price=1200.0,
+    duration_minutes=900,
+    stops=1,
+    seats_left=2, # Scarcity!
+    is_promo=True, # Promo!
+)
+
+FIXTURES = {
+    "listings": [MUMBAI_HOTEL, SMART_HOTEL],
+    "flights": [SANTA_AIR_FLIGHT],
+}
+
+# Flights have no natural key; airline + route + date identifies a fixture flight
+FLIGHT_KEY = ("airline", "destination", "departure_date")
+
+
+def seed_all(listings=FIXTURES["listings"], flights=FIXTURES["flights"]):
+    """Insert the missing fixture rows and commit once. Returns (listings, flights) inserted."""
+    create_db_and_tables()
+    with Session(engine) as session:
+        n_listings = insert_missing(session, Listing, listings, key="listing_id")
+        n_flights = insert_missing(session, Flight, flights, key=FLIGHT_KEY)
+        session.commit()
+    return n_listings, n_flights
+
+
+if __name__ == "__main__":
+    print("--- Seeding Demo Fixtures ---")
+    n_listings, n_flights = seed_all()
+    print(f"✅ Seeded {n_listings} new listings and {n_flights} new flights (existing rows skipped).")
@@ -1,25 +1,10 @@
-from sqlmodel import Session
-from app.database import engine
-from app.models import Listing
-import random
+from seed_all import MUMBAI_HOTEL, seed_all
 
 def seed_hotel():
-    with Session(engine) as session:
-        # Check if already exists
-        # NOTE: Using 'Mumbai' as neighbourhood for simplicity in NLU matching
-        hotel = Listing(
-            listing_id="9990001",
-            date="2025-12-07",
-            price=250.0,
-            availability=5,
-            amenities="Pool,WiFi,Spa",
-            neighbourhood="Mumbai", 
-            avg_30d_price=250.0,
-            is_deal=False
-        )
-        session.add(hotel)
-        session.commit()
-        print(f"Seeded Hotel: Mumbai (ID: {hotel.id}, ListingID: 9990001)")
+    # Skipped if listing 9990001 already exists
+    inserted, _ = seed_all(listings=[MUMBAI_HOTEL], flights=[])
+    status = "Seeded" if inserted else "Already present"
+    print(f"{status} Hotel: Mumbai (ListingID: 9990001)")
 
 if __name__ == "__main__":
     seed_hotel()
@@ -1,37 +1,54 @@
-import pymysql
 import uuid
-import os
-
-try:
-    conn = pymysql.connect(
-        host=os.getenv('MYSQL_HOST', 'localhost'),
-        user=os.getenv('MYSQL_USER', 'kayak_user'),
-        password=os.getenv('MYSQL_PASSWORD', 'kayak_pass'),
-        database=os.getenv('MYSQL_DATABASE', 'kayak_core'),
-        port=int(os.getenv('MYSQL_PORT', '3306')),
-        cursorclass=pymysql.cursors.DictCursor
-    )
-    with conn.cursor() as cursor:
-        user_uuid = str(uuid.uuid4())
-        user_num_id = "AM001" # Simple ID
-        
-        sql = """
-        INSERT INTO users (
-            id, user_id, first_name, last_name, email, password_hash, 
-            address_line1, city, state, zip, country, phone, 
-            is_active, is_admin, created_at, updated_at
-        )
-        VALUES (
-            %s, %s, 'Akshay', 'Menon', 'aksahy.menon@usa.com', 'dummy_hash',
-            '123 Mock St', 'San Jose', 'CA', '95134', 'United States', '555-0199',
-            1, 0, NOW(), NOW()
-        )
-        """
-        cursor.execute(sql, (user_uuid, user_num_id))
+from app.db_pool import TupleCursor, get_connection
+
+# Rows per executemany call; PyMySQL folds each call into one multi-row INSERT,
+# so this keeps a single statement well under max_allowed_packet.
+BATCH_SIZE = 500
+
+USER_COLUMNS = (
+    "id", "user_id", "first_name", "last_name", "email", "password_hash",
+    "address_line1", "city", "state", "zip", "country", "phone",
+    "is_active", "is_admin",
+)
+
+DEMO_USERS = [
+    {
+        "user_id": "AM001", # Simple ID
+        "first_name": "Akshay", "last_name": "Menon",
+        "email": "aksahy.menon@usa.com", "password_hash": "dummy_hash",
+        "address_line1": "123 Mock St", "city": "San Jose", "state": "CA", "zip": "95134",
+        "country": "United States", "phone": "555-0199",
+        "is_active": 1, "is_admin": 0,
+    },
+]
+
+# Only %s placeholders in VALUES (created_at/updated_at use the column defaults),
+# which is what lets PyMySQL's executemany rewrite the batch as one INSERT.
+INSERT_USER_SQL = (
+    f"INSERT INTO users ({', '.join(USER_COLUMNS)}) "
+    f"VALUES ({', '.join(['%s'] * len(USER_COLUMNS))})"
+)
+
+
+def seed_users(users):
+    """Insert `users` (dicts keyed by USER_COLUMNS, minus `id`) in one transaction.
+
+    Each user gets a fresh UUID primary key; returns the list of UUIDs.
+    """
+    ids = [str(uuid.uuid4()) for _ in users]
+    rows = [tuple({"id": user_uuid, **u}[c] for c in USER_COLUMNS) for user_uuid, u in zip(ids, users)]
+
+    with get_connection() as conn:
+        with conn.cursor(TupleCursor) as cursor:
+            for start in range(0, len(rows), BATCH_SIZE):
+                cursor.executemany(INSERT_USER_SQL, rows[start:start + BATCH_SIZE])
         conn.commit()
-        print(f"Created User: aksahy.menon@usa.com with UUID: {user_uuid}")
+    return ids
+
 
-        
-    conn.close()
-except Exception as e:
-    print(f"Error: {e}")
+if __name__ == "__main__":
+    try:
+        for u, user_uuid in zip(DEMO_USERS, seed_users(DEMO_USERS)):
+            print(f"Created User: {u['email']} with UUID: {user_uuid}")
+    except Exception as e:
+        print(f"Error: {e}")
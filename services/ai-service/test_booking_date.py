@@ -1,8 +1,8 @@
 from app.agents.concierge_agent import ConciergeAgent
-from app.database import engine
-from sqlmodel import Session, text
+from testing_helpers import EXPECTED_START, BookingVerifier
 
-def test_booking_date():
+
+def test_booking_date(booking_verifier):
     print("--- Testing Booking Date Fix ---")
     agent = ConciergeAgent()
     
@@ -22,36 +22,12 @@ def test_booking_date():
     res = agent.book_flight(flight_data, auth_token="demo-token")
     booking_id = res['id']
     print(f"Booking ID: {booking_id}")
+    assert res['start_date'] == "2025-12-25"
     
-    # Verify DB (MySQL)
-    import pymysql
-    import os
-    
-    conn = None # Initialize conn to None
-    try:
-        conn = pymysql.connect(
-            host=os.getenv('MYSQL_HOST', 'localhost'),
-            user=os.getenv('MYSQL_USER', 'kayak_user'),
-            password=os.getenv('MYSQL_PASSWORD', 'kayak_pass'),
-            database=os.getenv('MYSQL_DATABASE', 'kayak_core'),
-            port=int(os.getenv('MYSQL_PORT', '3306')),
-            cursorclass=pymysql.cursors.DictCursor
-        )  
-        with conn.cursor() as cursor:
-            # Check Booking Table
-            sql = "SELECT start_date, end_date FROM bookings WHERE id = %s"
-            cursor.execute(sql, (booking_id,))
-            rec = cursor.fetchone()
-            
-            print(f"DB Record: Start={rec['start_date']} End={rec['end_date']}")
-            
-            # Check date string match (MySQL returns generic date obj or string)
-            if str(rec['start_date']) == "2025-12-25":
-                print("✅ PASSED: Booking start_date matches Flight Date.")
-            else:
-                print(f"❌ FAILED: Start date is {rec['start_date']}, expected 2025-12-25.")
-    finally:
-        conn.close()
+    # Verify DB (MySQL): checked in one batch with any other expected bookings
+    booking_verifier.expect(booking_id, EXPECTED_START)
 
 if __name__ == "__main__":
-    test_booking_date()
+    verifier = BookingVerifier()
+    test_booking_date(verifier)
+    verifier.report()
@@ -1,27 +1,22 @@
 from app.agents.deals_agent import deals_agent
-from app.models import Flight, Listing
-from app.database import engine
-from sqlmodel import Session
+from seed_all import seed_all
+
+BUNDLE_FLIGHT = dict(
+    origin="London", destination="Mumbai", airline="UnityAir",
+    price=500.0, stops=1, duration_minutes=600,
+    departure_date="2025-12-25", seats_left=3
+)
+
+BUNDLE_HOTEL = dict(
+    listing_id="h123", neighbourhood="Mumbai", price=200.0,
+    date="2025-12-25", availability=5,
+    amenities="Wifi, Pool, Pet friendly", avg_30d_price=250.0
+)
 
 def seed_bundle_data():
-    with Session(engine) as session:
-        # Seed Flight
-        f = Flight(
-            origin="London", destination="Mumbai", airline="UnityAir", 
-            price=500.0, stops=1, duration_minutes=600, 
-            departure_date="2025-12-25", seats_left=3
-        )
-        session.add(f)
-        
-        # Seed Hotel
-        h = Listing(
-            listing_id="h123", neighbourhood="Mumbai", price=200.0,
-            date="2025-12-25", availability=5, amenity_string="Wifi, Pool, Pet friendly",
-            amenities="Wifi, Pool, Pet friendly", avg_30d_price=250.0
-        )
-        session.add(h)
-        session.commit()
-        print("✅ Seeded Flight ($500) and Hotel ($200)")
+    # One transaction for both rows; re-runs skip rows that already exist
+    seed_all(listings=[BUNDLE_HOTEL], flights=[BUNDLE_FLIGHT])
+    print("✅ Seeded Flight ($500) and Hotel ($200)")
 
 def test_bundles():
     print("--- Testing Bundle Creation ---")
@@ -17,11 +17,13 @@ async def test_date_filter():
     from app.agents.deals_agent import deals_agent
     recs = deals_agent.get_recommendations(destination="Mumbai", budget=5000, date="Dec 25")
     
-    found_santa = False
     for r in recs:
         print(f"   Shape: {r.get('airline')} - {r.get('departure_time')}")
-        if r.get('airline') == "Santa Air" and "12-25" in str(r.get('departure_time')):
-             found_santa = True
+    # Cheap airline equality first; stops at the first hit
+    found_santa = any(
+        r.get('airline') == "Santa Air" and "12-25" in str(r.get('departure_time'))
+        for r in recs
+    )
              
     if found_santa:
         print("✅ PASSED: Found Santa Air on Dec 25.")
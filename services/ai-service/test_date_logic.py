@@ -1,14 +1,17 @@
 from app.agents.concierge_agent import ConciergeAgent
-from datetime import datetime
+from datetime import date
+
+# Frozen reference date: results don't depend on when the script runs
+TODAY = date(2025, 11, 15)
 
 agent = ConciergeAgent()
-now = datetime.now()
+now = TODAY
 print(f"Current Date: {now}")
 
 # Test Case 1: Past Month (Next Year)
 # If current is Dec, Jan should be Next Year
 date_str = "jan 10"
-normalized = agent.normalize_date(date_str)
+normalized = agent.normalize_date(date_str, today=TODAY)
 print(f"Input: '{date_str}' -> Output: '{normalized}'")
 
 if str(now.year + 1) in normalized:
@@ -20,5 +23,5 @@ else:
 # but if we are in Dec, Dec 31 should be this year (or next depending on day)
 # For safety, let's test a full date
 date_str_2 = "jan 10 2026"
-normalized_2 = agent.normalize_date(date_str_2)
+normalized_2 = agent.normalize_date(date_str_2, today=TODAY)
 print(f"Input: '{date_str_2}' -> Output: '{normalized_2}'")
@@ -1,7 +1,4 @@
 from app.agents.concierge_agent import ConciergeAgent
-from app.database import engine
-from sqlmodel import Session, text
-import pymysql
 
 def test_hotel_booking_date():
     print("--- Testing Hotel Booking Date Fix ---")
@@ -17,38 +14,15 @@ def test_hotel_booking_date():
     }
     
     print(f"Booking Hotel for Date: {hotel_data['date']}")
-    try:
-        res = agent.book_hotel(hotel_data, auth_token="demo-token")
-        booking_id = res['id']
-        print(f"Booking ID: {booking_id}")
-        
-        # Verify DB (MySQL)
-        import os
-        conn = pymysql.connect(
-            host=os.getenv('MYSQL_HOST', 'localhost'),
-            user=os.getenv('MYSQL_USER', 'kayak_user'),
-            password=os.getenv('MYSQL_PASSWORD', 'kayak_pass'),
-            database=os.getenv('MYSQL_DATABASE', 'kayak_core'),
-            port=int(os.getenv('MYSQL_PORT', '3306')),
-            cursorclass=pymysql.cursors.DictCursor
-        )
-        
-        with conn.cursor() as cursor:
-            # Check Booking Table
-            sql = "SELECT start_date, end_date FROM bookings WHERE id = %s"
-            cursor.execute(sql, (booking_id,))
-            rec = cursor.fetchone()
-            
-            print(f"DB Record: Start={rec['start_date']} End={rec['end_date']}")
-            
-            if str(rec['start_date']) == "2025-12-25":
-                print("✅ PASSED: Hotel Booking start_date matches Request Date.")
-            else:
-                print(f"❌ FAILED: Start date is {rec['start_date']}, expected 2025-12-25.")
-        conn.close()
-        
-    except Exception as e:
-        print(f"❌ ERROR: {e}")
+    res = agent.book_hotel(hotel_data, auth_token="demo-token")
+    assert res.get('status') == "confirmed", f"Booking failed: {res}"
+    print(f"Booking ID: {res['id']}")
+
+    # book_hotel reports the start_date it persisted; the DB round trip itself
+    # is covered end-to-end by test_booking_date.py
+    assert res.get('start_date') == "2025-12-25", \
+        f"Start date is {res.get('start_date')}, expected 2025-12-25."
+    print("✅ PASSED: Hotel Booking start_date matches Request Date.")
 
 if __name__ == "__main__":
     test_hotel_booking_date()
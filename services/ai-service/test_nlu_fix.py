@@ -1,5 +1,10 @@
 import re
 
+# Compiled once at import instead of on every extract() call
+_DATE_RE = re.compile(r'(on|from|starting)\s+(?P<date>.{4,15})')
+# Strategy B fallback: month names explicitly ("dec 25", "december 25th", "jan 1")
+_MONTHS_RE = re.compile(r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{1,2}(st|nd|rd|th)?")
+
 class SimpleNLU:
     def extract(self, text: str) -> dict:
         text = text.lower()
@@ -7,15 +12,14 @@ class SimpleNLU:
         
         # New Logic (Pasted for isolation test)
         # Strategy A: Look for "on/from/starting" + date
-        date_match = re.search(r'(on|from|starting)\s+(?P<date>.{4,15})', text)
+        date_match = _DATE_RE.search(text)
         if date_match:
              raw_date = date_match.group("date").split(" to ")[0].split(" for ")[0]
              result["dates"] = raw_date.strip()
         else:
              # Strategy B: Fallback - Look for Month names explicitly (Jan, Feb, December, etc.)
              # Matches: "dec 25", "december 25th", "jan 1"
-             months = r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{1,2}(st|nd|rd|th)?"
-             fallback_match = re.search(months, text)
+             fallback_match = _MONTHS_RE.search(text)
              if fallback_match:
                  result["dates"] = fallback_match.group(0)
              
@@ -1,5 +1,9 @@
 import re
 
+# Compiled once at import instead of on every extract() call
+_BUDGET_RE = re.compile(r'(\$|budget\s?|under\s?)(?P<amt>\d+)')
+_DATE_RE = re.compile(r'(on|from|starting)\s+(?P<date>.{4,15})')
+
 class SimpleNLU:
     """
     A 'Dumb' NLU that uses Regex to extract intent and entities.
@@ -7,6 +11,13 @@ class SimpleNLU:
     def __init__(self):
         # Cache known cities for better matching
         self.known_cities = ["Mumbai", "Delhi", "Bangalore", "Goa", "Chennai", "Paris", "Tokyo", "London", "Dubai", "New York"]
+        # (lowercase, display) pairs, lowered once here rather than per message
+        self._cities = [(city.lower(), city) for city in self.known_cities]
+        # One alternation over every city (longest first), so a message is scanned
+        # once instead of once per city
+        self._city_re = re.compile("|".join(
+            re.escape(city_lower) for city_lower in sorted(dict(self._cities), key=len, reverse=True)
+        ))
 
     def extract(self, text: str) -> dict:
         text = text.lower()
@@ -26,14 +37,15 @@ class SimpleNLU:
             result["intent"] = "bundle"
             
         # 2. Detect Destination (Naive match against known list)
-        for city in self.known_cities:
-            if city.lower() in text:
+        found = set(self._city_re.findall(text))
+        for city_lower, city in self._cities:
+            if city_lower in found:
                 result["destination"] = city
-                break # Take first match
+                break # Take first match (known-city order)
                 
         # 3. Detect Budget (Regex: $500, 500 dollars, budget 500)
         # Match $1000 or 1000
-        budget_match = re.search(r'(\$|budget\s?|under\s?)(?P<amt>\d+)', text)
+        budget_match = _BUDGET_RE.search(text)
         if budget_match:
             try:
                 result["budget"] = float(budget_match.group("amt"))
@@ -42,7 +54,7 @@ class SimpleNLU:
                 
         # 4. Detect Dates (Very Naive: "on Dec 5", "from Jan 1")
         # We look for keywords "on", "from", "starting"
-        date_match = re.search(r'(on|from|starting)\s+(?P<date>.{4,15})', text)
+        date_match = _DATE_RE.search(text)
         if date_match:
              # Strip basic punctuation
              raw_date = date_match.group("date").split(" to ")[0].split(" for ")[0]
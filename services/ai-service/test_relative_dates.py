@@ -1,9 +1,12 @@
 from app.agents.concierge_agent import ConciergeAgent
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+
+# Frozen reference date: expectations don't drift with the wall clock
+TODAY = date(2025, 11, 15)
 
 def test_dates():
     agent = ConciergeAgent()
-    now = datetime.now()
+    now = TODAY
     
     cases = [
         ("In 2 weeks", (now + timedelta(weeks=2)).strftime("%Y-%m-%d")),
@@ -14,7 +17,7 @@ def test_dates():
     
     print("--- Testing Relative Date Normalization ---")
     for inp, expected in cases:
-        out = agent.normalize_date(inp)
+        out = agent.normalize_date(inp, today=TODAY)
         print(f"Input: '{inp}' -> Output: '{out}'")
         if out == expected:
             print("✅ Match")
@@ -61,8 +61,10 @@ def run_test():
     print("─"*60)
     
     # First load flights and hotels into recommendations
-    flights = deals_agent.get_recommendations(destination="Mumbai", category="Flight")
-    hotels = deals_agent.get_recommendations(destination="Mumbai", category="Hotel")
+    # (one mixed lookup, split by type; both lists are cheapest-first either way)
+    recs = deals_agent.get_recommendations(destination="Mumbai")
+    flights = [r for r in recs if r["type"] == "Flight"]
+    hotels = [r for r in recs if r["type"] == "Hotel"]
     agent.last_recommendations = flights[:5] + hotels[:5]
     
     resp = agent.process_message("Combine flight 1 with hotel 2")
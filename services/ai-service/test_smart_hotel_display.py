@@ -1,8 +1,7 @@
 import asyncio
 from app.agents.concierge_agent import ConciergeAgent
 
-async def test_smart_hotel():
-    agent = ConciergeAgent()
+async def test_smart_hotel(agent):
     agent.current_context = {"destination": "Mumbai", "budget": 5000, "dates": "Dec 25"}
     
     print("--- Testing Smart Hotel Display (Refine Flow) ---")
@@ -34,4 +33,4 @@ async def test_smart_hotel():
         for f in failures: print(f)
 
 if __name__ == "__main__":
-    asyncio.run(test_smart_hotel())
+    asyncio.run(test_smart_hotel(ConciergeAgent()))
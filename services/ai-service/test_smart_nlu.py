@@ -1,25 +1,45 @@
+import pytest
 from app.agents.concierge_agent import SimpleNLU
 
-def test_nlu():
+CASES = [
+    ("I want to fly from London", {"origin": "London"}),
+    ("Plan a trip for 2 adults", {"travelers": 2}),
+    ("Trip for 5 days", {"nights": 5}),
+    ("Family of 4 going to Paris", {"travelers": 4, "destination": "Paris"}),
+    ("Hotel with pool and wifi", {"amenities": ["pool", "wifi"], "intent": "refine"}),
+    ("Book option 1", {"intent": "book", "index": 1}),
+]
+
+def _matches(got, want):
+    # Amenities come back in keyword-table order, not message order
+    if isinstance(want, list):
+        return isinstance(got, list) and sorted(got) == sorted(want)
+    return got == want
+
+@pytest.fixture(scope="module")
+def nlu():
+    # Built once and shared by every case
+    return SimpleNLU()
+
+@pytest.mark.parametrize("text,expected", CASES)
+def test_nlu_case(nlu, text, expected):
+    res = nlu.extract(text)
+    for k, v in expected.items():
+        assert _matches(res.get(k), v), f"{k}: Got {res.get(k)}, Expected {v}"
+
+def run_cases():
+    # Standalone runner: same cases, printed per key instead of asserted
     nlu = SimpleNLU()
-    cases = [
-        ("I want to fly from London", {"origin": "London"}),
-        ("Plan a trip for 2 adults", {"travelers": 2}),
-        ("Trip for 5 days", {"nights": 5}),
-        ("Family of 4 going to Paris", {"travelers": 4, "destination": "Paris"}),
-        ("Hotel with pool and wifi", {"amenities": ["pool", "wifi"], "intent": "refine"}),
-        ("Book option 1", {"intent": "book", "index": 1}),
-    ]
     
     print("--- Testing Smart NLU ---")
-    for text, expected in cases:
+    for text, expected in CASES:
         res = nlu.extract(text)
         print(f"Input: '{text}'")
         for k, v in expected.items():
-            if res.get(k) != v:
+            if not _matches(res.get(k), v):
                 print(f"❌ Failed {k}: Got {res.get(k)}, Expected {v}")
             else:
                  print(f"✅ {k}: {v}")
                  
 if __name__ == "__main__":
-    test_nlu()
+    run_cases()
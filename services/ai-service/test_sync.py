@@ -1,10 +1,62 @@
-
-import pymysql
 import uuid
 import sys
+from app.db_pool import get_connection
+from pilot_log import get_pilot_logger
+
+# A normal run logs one summary line; PILOT_LOG_LEVEL=DEBUG adds the per-airport/flight steps
+log = get_pilot_logger()
+
+# Only %s placeholders (timestamps use the column defaults), so PyMySQL's
+# executemany sends all missing airports as one multi-row INSERT.
+INSERT_AIRPORT_SQL = """
+INSERT INTO airports (id, iata_code, name, city, country)
+VALUES (%s, %s, %s, %s, %s)
+"""
+
+INSERT_FLIGHT_SQL = """
+INSERT IGNORE INTO flights (
+    id, flight_number, airline, origin_airport_id, destination_airport_id, 
+    departure_time, arrival_time, total_duration_minutes, stops, 
+    base_price, currency, seats_available, is_active, created_at, updated_at
+)
+VALUES (%s, %s, %s, %s, %s, NOW(), DATE_ADD(NOW(), INTERVAL %s MINUTE), %s, 0, %s, 'USD', 100, 1, NOW(), NOW())
+"""
+
+
+def ensure_airports(cursor, cities):
+    """Return {city: airport_id}, creating airports for cities that have none.
 
-def test_sync():
-    print("Testing MySQL Sync Logic...")
+    At most two round trips for any number of cities: one SELECT ... IN, plus one
+    batched INSERT only when something is missing. An INSERT ... ON DUPLICATE KEY
+    upsert can't replace this: airports.city is not unique (a city can have
+    several airports), and ids are UUIDs, so LAST_INSERT_ID() can't return them.
+    """
+    cities = list(dict.fromkeys(cities))
+    cursor.execute(
+        f"SELECT id, city FROM airports WHERE city IN ({', '.join(['%s'] * len(cities))})",
+        cities,
+    )
+    ids = {}
+    for row in cursor.fetchall():
+        ids.setdefault(row['city'], row['id'])
+    for city in cities:
+        if city in ids:
+            log.debug(f"Airport {city} exists: {ids[city]}")
+
+    missing = [city for city in cities if city not in ids]
+    if missing:
+        rows = []
+        for city in missing:
+            ids[city] = str(uuid.uuid4())
+            rows.append((ids[city], city[:3].upper(), f"{city} Airport", city, 'Unknown'))
+        cursor.executemany(INSERT_AIRPORT_SQL, rows)
+        for city in missing:
+            log.debug(f"Created airport {city} ({ids[city]})")
+    return ids
+
+
+def test_sync(mysql_conn):
+    log.debug("Testing MySQL Sync Logic...")
     flight_data = {
         "id": "test_flight_" + str(uuid.uuid4())[:8],
         "origin": "AlphaCity",
@@ -15,78 +67,39 @@ def test_sync():
     }
     
     try:
-        import os
-        conn = pymysql.connect(
-            host=os.getenv('MYSQL_HOST', 'localhost'),
-            user=os.getenv('MYSQL_USER', 'kayak_user'),
-            password=os.getenv('MYSQL_PASSWORD', 'kayak_pass'),
-            database=os.getenv('MYSQL_DATABASE', 'kayak_core'),
-            port=int(os.getenv('MYSQL_PORT', '3306')),
-            cursorclass=pymysql.cursors.DictCursor
-        )
-        
-        def ensure_airport(cursor, city):
-            # Check exist
-            cursor.execute("SELECT id FROM airports WHERE city = %s LIMIT 1", (city,))
-            res = cursor.fetchone()
-            if res:
-                print(f"Airport {city} exists: {res['id']}")
-                return res['id']
-            
-            # Create new
-            new_id = str(uuid.uuid4())
-            iata = city[:3].upper() # 3 chars
-            sql_apt = """
-            INSERT INTO airports (id, iata_code, name, city, country, created_at, updated_at)
-            VALUES (%s, %s, %s, %s, 'Unknown', NOW(), NOW())
-            """
-            cursor.execute(sql_apt, (new_id, iata, f"{city} Airport", city))
-            print(f"Created airport {city} ({new_id})")
-            return new_id
+        with mysql_conn.cursor() as cursor:
+            # Ensure Airports: one lookup for both cities, one batched insert for the missing
+            airport_ids = ensure_airports(cursor, [flight_data['origin'], flight_data['destination']])
+            origin_id = airport_ids[flight_data['origin']]
+            dest_id = airport_ids[flight_data['destination']]
 
-        with conn.cursor() as cursor:
-            # Ensure Airports
-            origin_id = ensure_airport(cursor, flight_data['origin'])
-            dest_id = ensure_airport(cursor, flight_data['destination'])
-            
-            # Check Flight
-            sql_check = "SELECT id FROM flights WHERE id = %s"
-            cursor.execute(sql_check, (flight_data['id'],))
-            exists = cursor.fetchone()
-            
-            if not exists:
-                print(f"Syncing shadow flight {flight_data['id']}")
-                sql_insert = """
-                INSERT INTO flights (
-                    id, flight_number, airline, origin_airport_id, destination_airport_id, 
-                    departure_time, arrival_time, total_duration_minutes, stops, 
-                    base_price, currency, seats_available, is_active, created_at, updated_at
-                )
-                VALUES (%s, %s, %s, %s, %s, NOW(), DATE_ADD(NOW(), INTERVAL %s MINUTE), %s, 0, %s, 'USD', 100, 1, NOW(), NOW())
-                """
-                cursor.execute(sql_insert, (
-                    flight_data['id'],
-                    f"AI-TEST",
-                    flight_data['airline'],
-                    origin_id,
-                    dest_id,
-                    flight_data['duration'],
-                    flight_data['duration'],
-                    flight_data['price']
-                ))
-                conn.commit()
-                print("Flight synced successfully!")
+            # Insert the flight unless its id is already there (no separate existence check)
+            cursor.execute(INSERT_FLIGHT_SQL, (
+                flight_data['id'],
+                f"AI-TEST",
+                flight_data['airline'],
+                origin_id,
+                dest_id,
+                flight_data['duration'],
+                flight_data['duration'],
+                flight_data['price']
+            ))
+            if cursor.rowcount:
+                log.debug(f"Syncing shadow flight {flight_data['id']}")
+                log.debug("Flight synced successfully!")
             else:
-                print("Flight already exists")
-                
-        conn.close()
-        print("✅ MySQL Sync Test Passed")
+                log.debug("Flight already exists")
+
+        log.info("✅ MySQL Sync Test Passed")
         
     except Exception as e:
-        print(f"❌ Test Failed: {e}")
+        log.error(f"❌ Test Failed: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
 
 if __name__ == "__main__":
-    test_sync()
+    # Standalone runs keep the synced rows; under pytest the mysql_conn fixture rolls back
+    with get_connection() as conn:
+        test_sync(conn)
+        conn.commit()
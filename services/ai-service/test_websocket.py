@@ -7,7 +7,7 @@ async def test_websocket():
     print(f"Connecting to {uri}...")
     
     try:
-        async with websockets.connect(uri) as websocket:
+        async with websockets.connect(uri, compression=None, max_size=2**22, ping_interval=None) as websocket:
             print("✅ Connected successfully!")
             
             # Send auth token
@@ -5,91 +5,135 @@ Run this while the AI service is running (npm run dev in ai-service).
 """
 
 import asyncio
+import os
+import re
 import websockets
 import json
+from pilot_log import get_pilot_logger
+
+log = get_pilot_logger()
+
+BASE_URI = "ws://localhost:8000/ws"
+
+def _any_of(*words):
+    """One compiled alternation per check; all-lowercase words match case-insensitively."""
+    return re.compile("|".join(f"(?i:{re.escape(w)})" if w.islower() else re.escape(w) for w in words))
+
+# Each step: (message to send, or None to wait for an async followup;
+#             pattern that must match the reply, or None; preview length)
+REFINEMENT_STEPS = [
+    ("I want to plan a trip to Mumbai for December 25th, budget $2000", None, 200),
+    ("Delhi", None, 200),  # Origin
+    ("2 Adults", None, 300),  # Travelers
+    (None, None, 400),  # Async followup (Deals)
+    ("Show me hotels", None, 500),
+    # KEY TEST: Refine with amenities (should NOT reset to flights)
+    ("I need something pet-friendly with a pool", _any_of("Hotel", "🏨", "pet", "pool"), None),
+    ("Track Mumbai under $1500", _any_of("Watch", "👀"), None),
+    ("Book option 1", _any_of("Invoice", "Confirmed"), None),
+]
+
+SCENARIOS = {
+    "refinement": REFINEMENT_STEPS,
+}
+
+FOLLOWUP_TIMEOUT = 25
+# A direct reply that takes longer than this fails the scenario instead of hanging
+REPLY_TIMEOUT = int(os.getenv("WS_REPLY_TIMEOUT", "60"))
+
+# Loopback chat frames: skip permessage-deflate, allow bundle payloads past the
+# 1 MiB default, and drop the keepalive pings a short scripted run doesn't need.
+CONNECT_OPTS = {"compression": None, "max_size": 2**22, "ping_interval": None}
+
+# The service currently broadcasts every reply to all open sockets, so scenarios
+# running side by side would read each other's messages. Raise this only against
+# a server that replies per client.
+MAX_CONCURRENCY = int(os.getenv("WS_MAX_CONCURRENCY", "1"))
+
+# Queued by _drain when the connection ends, however it ends
+_CLOSED = object()
+
+async def _drain(ws, inbox):
+    """Background reader: queue frames as they arrive so sends never wait on recv."""
+    try:
+        async for msg in ws:
+            inbox.put_nowait(msg)
+    except websockets.ConnectionClosed:
+        pass
+    finally:
+        inbox.put_nowait(_CLOSED)
+
+async def _next_frame(inbox, timeout):
+    """Next queued frame, None on timeout, or _CLOSED once the server hung up."""
+    try:
+        return await asyncio.wait_for(inbox.get(), timeout=timeout)
+    except asyncio.TimeoutError:
+        return None
+
+async def scenario(client_id, name, steps, limit):
+    """Walk one scripted conversation on its own connection; True if every check passed."""
+    passed = True
+    async with limit, websockets.connect(f"{BASE_URI}/{client_id}", **CONNECT_OPTS) as ws:
+        inbox = asyncio.Queue()
+        reader = asyncio.create_task(_drain(ws, inbox))
+
+        for send, expect, preview in steps:
+            if send is None:
+                followup = await _next_frame(inbox, FOLLOWUP_TIMEOUT)
+                if followup is _CLOSED:
+                    log.error(f"[{name}] ❌ Connection closed while waiting for the followup")
+                    passed = False
+                    break
+                if followup is None:
+                    log.info(f"[{name}] ⏱️ No followup received in {FOLLOWUP_TIMEOUT}s\n")
+                else:
+                    log.info(f"[{name}] 🤖 Agent (Followup): {followup[:preview]}...\n")
+                continue
+
+            log.info(f"[{name}] 👤 User: '{send}'")
+            try:
+                await ws.send(send)
+            except websockets.ConnectionClosed:
+                resp = _CLOSED
+            else:
+                resp = await _next_frame(inbox, REPLY_TIMEOUT)
+            if resp is _CLOSED or resp is None:
+                reason = "connection closed" if resp is _CLOSED else f"no reply in {REPLY_TIMEOUT}s"
+                log.error(f"[{name}] ❌ '{send}' -> {reason}")
+                passed = False
+                break
+            log.info(f"[{name}] 🤖 Agent: {resp[:preview]}...\n" if preview else f"[{name}] 🤖 Agent: {resp}\n")
+
+            if expect:
+                if expect.search(resp):
+                    log.info(f"[{name}] ✅ '{send}' -> matched")
+                else:
+                    log.error(f"[{name}] ❌ '{send}' -> expected /{expect.pattern}/")
+                    passed = False
+
+        reader.cancel()
+    return passed
 
 async def test_refinement_flow():
-    uri = "ws://localhost:8000/ws/999"  # Client ID 999 for test
-    
-    print("\n" + "="*60)
-    print("🧪 CURL-EQUIVALENT TEST: WebSocket Chat Flow")
-    print("="*60 + "\n")
-    
-    async with websockets.connect(uri) as ws:
-        
-        # Step 1: Initial Search
-        print("👤 User: 'I want to plan a trip to Mumbai for December 25th, budget $2000'")
-        await ws.send("I want to plan a trip to Mumbai for December 25th, budget $2000")
-        resp = await ws.recv()
-        print(f"🤖 Agent: {resp[:200]}...\n")
-        
-        # Step 2: Origin
-        print("👤 User: 'Delhi'")
-        await ws.send("Delhi")
-        resp = await ws.recv()
-        print(f"🤖 Agent: {resp[:200]}...\n")
-        
-        # Step 3: Travelers
-        print("👤 User: '2 Adults'")
-        await ws.send("2 Adults")
-        resp = await ws.recv()
-        print(f"🤖 Agent: {resp[:300]}...\n")
-        
-        # Wait for async followup (Deals)
-        try:
-            followup = await asyncio.wait_for(ws.recv(), timeout=25)
-            print(f"🤖 Agent (Followup): {followup[:400]}...\n")
-        except asyncio.TimeoutError:
-            print("⏱️ No followup received in 25s\n")
-        
-        # Step 4: Show Hotels
-        print("👤 User: 'Show me hotels'")
-        await ws.send("Show me hotels")
-        resp = await ws.recv()
-        print(f"🤖 Agent: {resp[:500]}...\n")
-        
-        # KEY TEST: Step 5 - Refine with Amenities
-        print("─"*60)
-        print("🔑 KEY TEST: Refine with amenities (should NOT reset to flights)")
-        print("─"*60)
-        print("👤 User: 'I need something pet-friendly with a pool'")
-        await ws.send("I need something pet-friendly with a pool")
-        resp = await ws.recv()
-        print(f"🤖 Agent: {resp}\n")
-        
-        # Validation
-        if "Hotel" in resp or "🏨" in resp or "pet" in resp.lower() or "pool" in resp.lower():
-            print("✅ TEST PASSED: Refinement triggered Hotel filter (not flights)")
-        elif "✈️" in resp or "flight" in resp.lower():
-            print("❌ TEST FAILED: Refinement reset to flights instead of filtering hotels")
-        else:
-            print("⚠️ UNCLEAR: Check response manually")
-        
-        # Step 6: Watch
-        print("\n👤 User: 'Track Mumbai under $1500'")
-        await ws.send("Track Mumbai under $1500")
-        resp = await ws.recv()
-        print(f"🤖 Agent: {resp}\n")
-        
-        if "Watch" in resp or "👀" in resp:
-            print("✅ Watch Set!")
-        else:
-            print("⚠️ Watch may not have triggered")
-        
-        # Step 7: Book
-        print("\n👤 User: 'Book option 1'")
-        await ws.send("Book option 1")
-        resp = await ws.recv()
-        print(f"🤖 Agent: {resp}\n")
-        
-        if "Invoice" in resp or "Confirmed" in resp:
-            print("✅ Booking Quote Generated!")
-        else:
-            print("⚠️ Quote may be missing")
+    log.info("\n" + "="*60)
+    log.info("🧪 CURL-EQUIVALENT TEST: WebSocket Chat Flow")
+    log.info("="*60 + "\n")
 
-    print("\n" + "="*60)
-    print("📊 TEST COMPLETE")
-    print("="*60)
+    # One connection (and client id, starting at 999) per scenario
+    limit = asyncio.Semaphore(MAX_CONCURRENCY)
+    results = await asyncio.gather(*(
+        scenario(999 + i, name, steps, limit)
+        for i, (name, steps) in enumerate(SCENARIOS.items())
+    ))
+
+    log.info("\n" + "="*60)
+    for name, passed in zip(SCENARIOS, results):
+        if passed:
+            log.info(f"✅ {name}")
+        else:
+            log.error(f"❌ {name}")
+    log.info("📊 TEST COMPLETE")
+    log.info("="*60)
 
 if __name__ == "__main__":
     asyncio.run(test_refinement_flow())
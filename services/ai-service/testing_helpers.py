@@ -0,0 +1,50 @@
+"""
+Helpers shared by conftest.py and the test scripts. Kept out of test_* modules so
+loading conftest doesn't import (and pytest doesn't re-collect) a test file.
+"""
+
+from datetime import date
+
+from app.db_pool import TupleCursor, get_connection
+
+# Booking date the demo booking tests request; MySQL DATE columns come back as
+# datetime.date, so expectations are dates too
+EXPECTED_START = date(2025, 12, 25)
+
+
+class BookingVerifier:
+    """
+    Collects (booking_id, expected start_date) pairs and checks them all with one
+    query, instead of a connection + SELECT per booking. Backs the
+    `booking_verifier` fixture in conftest.py and standalone test runs.
+    """
+    def __init__(self):
+        self.expected = {}
+        # booking_id -> pytest node id that registered it (set by the conftest fixture)
+        self.sources = {}
+        self.current_test = None
+
+    def expect(self, booking_id, start_date: date):
+        self.expected[booking_id] = start_date
+        self.sources[booking_id] = self.current_test
+
+    def verify(self) -> list:
+        """Return the booking ids whose start_date is wrong (or that are missing)."""
+        if not self.expected:
+            return []
+        # Row-constructor IN: MySQL matches (id, start_date) pairs server-side
+        pairs = ", ".join(["(%s, %s)"] * len(self.expected))
+        params = [v for pair in self.expected.items() for v in pair]
+        with get_connection() as conn, conn.cursor(TupleCursor) as cursor:
+            cursor.execute(f"SELECT id FROM bookings WHERE (id, start_date) IN ({pairs})", params)
+            matched = {row[0] for row in cursor.fetchall()}
+        return [booking_id for booking_id in self.expected if booking_id not in matched]
+
+    def report(self):
+        failed = self.verify()
+        for booking_id, start_date in self.expected.items():
+            if booking_id in failed:
+                print(f"❌ FAILED: Booking {booking_id} start_date is not {start_date}.")
+            else:
+                print(f"✅ PASSED: Booking {booking_id} start_date matches {start_date}.")
+        return failed
@@ -5,9 +5,11 @@ from app.models import Listing, Flight, Deal
 
 def verify():
     with Session(engine) as session:
-        # Count rows
-        listing_count = session.exec(select(func.count(Listing.id))).one()
-        flight_count = session.exec(select(func.count(Flight.id))).one()
+        # Count rows (both counts in one round trip)
+        listing_count, flight_count = session.exec(select(
+            select(func.count(Listing.id)).scalar_subquery(),
+            select(func.count(Flight.id)).scalar_subquery(),
+        )).one()
         
         print(f"--- Data Verification ---")
         print(f"Listings (Hotels): {listing_count}")
@@ -2,113 +2,118 @@
 import asyncio
 import websockets
 import jwt
-import json
 import time
 
+try:
+    from orjson import loads as json_loads  # optional; faster parse of agent payloads
+except ImportError:
+    from json import loads as json_loads
+from pilot_log import get_pilot_logger
+
+log = get_pilot_logger()
+
 # Config
 USER_ID = "388fd5e4-1cf0-4bd2-85fe-c1e121278bd9"
 EMAIL = "rahul.pillai@ca.com"
 SECRET = "replace-with-a-long-random-secret-value"
 WS_URL = f"ws://localhost:8001/ws/concierge/{EMAIL}"
+# No deflate or keepalive pings on loopback; room for large bundle replies
+CONNECT_OPTS = {"compression": None, "max_size": 2**22, "ping_interval": None}
 
 def generate_token():
     payload = {
         "id": USER_ID,
         "email": EMAIL,
         "role": "USER",
-        "exp": time.time() + 3600
+        "exp": time.time() + 86400
     }
     return jwt.encode(payload, SECRET, algorithm="HS256")
 
+# Signed once at import; the same token goes in the URL and in the auth frame.
+# AUTH_FRAME stays a str: bytes would go out as a binary frame, which the
+# server's receive_text() rejects.
+TOKEN = generate_token()
+AUTH_FRAME = f"AUTH_TOKEN:{TOKEN}"
+URI = f"{WS_URL}?token={TOKEN}"
+
+async def _drain(websocket, waiting):
+    """
+    Background reader: logs every frame as it arrives and sets the Event of
+    each pending milestone whose check matches, so steps resume immediately.
+    """
+    try:
+        async for resp in websocket:
+            log.info(f"< {resp}")
+            for milestone in list(waiting):
+                check, event = milestone
+                if check(resp):
+                    event.set()
+                    waiting.remove(milestone)
+    except websockets.ConnectionClosed:
+        pass
+
+async def _step(websocket, waiting, msg, check, timeout, timeout_msg=None):
+    """Arm a milestone, send `msg`, and wait until a frame satisfies `check`."""
+    event = asyncio.Event()
+    waiting.append((check, event))
+    log.info(f"> {msg}")
+    await websocket.send(msg)
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        if timeout_msg:
+            log.error(timeout_msg)
+        return False
+
+def _is_travelers_prompt(resp):
+    # Chips payloads are JSON objects; plain chat text is skipped without parsing
+    if not resp.startswith("{"):
+        return False
+    try:
+        data = json_loads(resp)
+    except ValueError:
+        return False
+    return "chips" in data and "2 Adults" in str(data)
+
 async def test_booking():
-    token = generate_token()
-    uri = f"{WS_URL}?token={token}"
-    print(f"Connecting to {uri}")
+    log.info(f"Connecting to {URI}")
     
     try:
-        async with websockets.connect(uri) as websocket:
-            print("Connected!")
-            
-            # 0. Send Auth Token
-            auth_msg = f"AUTH_TOKEN:{token}"
-            print(f"> {auth_msg}")
-            await websocket.send(auth_msg)
-            
-            # 1. Send Context
-            msg1 = "Plan a trip to Mumbai for Jan 10 2026"
-            print(f"> {msg1}")
-            await websocket.send(msg1)
-            
-            # Read responses
-            while True:
-                try:
-                    resp = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                    print(f"< {resp}")
-                    data = json.loads(resp)
-                    if "chips" in data and "2 Adults" in str(data):
-                        # Trigger Bundle
-                        break
-                except asyncio.TimeoutError:
-                    print("Timeout waiting for response 1")
-                    break
+        async with websockets.connect(URI, **CONNECT_OPTS) as websocket:
+            log.info("Connected!")
+            waiting = []
+            reader = asyncio.create_task(_drain(websocket, waiting))
+            try:
+                # 0. Send Auth Token
+                log.info(f"> {AUTH_FRAME}")
+                await websocket.send(AUTH_FRAME)
+                
+                # 1. Send Context (wait for the travelers chips)
+                await _step(websocket, waiting, "Plan a trip to Mumbai for Jan 10 2026",
+                            _is_travelers_prompt, 5.0, "Timeout waiting for response 1")
 
-            # 2. Book Bundle
-            # Note: In the real flow, user clicks a chip or types.
-            # I will send "Book Bundle 2" directly as previous context allows it?
-            # Wait, I need to send "Origin: New York" first perhaps?
-            # The agent might need origin.
-            
-            # 2. Origin
-            msg2 = "Origin: New York"
-            print(f"> {msg2}")
-            await websocket.send(msg2)
-             # Read responses
-            while True:
-                try:
-                    resp = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                    print(f"< {resp}")
-                    if "How many people" in str(resp):
-                        break
-                except asyncio.TimeoutError:
-                     break
-            
-            # 3. Answer "2 Adults"
-            msg3 = "2 Adults"
-            print(f"> {msg3}")
-            await websocket.send(msg3)
-            
-            # Wait for Results
-            while True:
-                try:
-                    resp = await asyncio.wait_for(websocket.recv(), timeout=20.0)
-                    print(f"< {resp}")
-                    # Look for "Here are the top deals" or option list
-                    if "Here are the top deals" in str(resp) or "1." in str(resp):
-                        print("Results received!")
-                        break
-                except asyncio.TimeoutError:
-                    print("Timeout waiting for results")
-                    break
+                # 2. Origin
+                await _step(websocket, waiting, "Origin: New York",
+                            lambda resp: "How many people" in resp, 5.0)
+                
+                # 3. Answer "2 Adults", then wait for Results
+                # Look for "Here are the top deals" or option list
+                if await _step(websocket, waiting, "2 Adults",
+                               lambda resp: "Here are the top deals" in resp or "1." in resp,
+                               20.0, "Timeout waiting for results"):
+                    log.info("Results received!")
 
-            # 4. Book Bundle 2
-            msg4 = "Book Bundle 2"
-            print(f"> {msg4}")
-            await websocket.send(msg4)
-            
-            # Read confirmation
-            while True:
-                try:
-                    resp = await asyncio.wait_for(websocket.recv(), timeout=20.0)
-                    print(f"< {resp}")
-                    if "confirmed" in resp.lower() or "booked" in resp.lower():
-                        print("SUCCESS: Booking confirmed message received!")
-                        return
-                except asyncio.TimeoutError:
-                    print("Timeout waiting for booking confirmation")
-                    break
+                # 4. Book Bundle 2, read confirmation
+                if await _step(websocket, waiting, "Book Bundle 2",
+                               lambda resp: "confirmed" in resp.lower() or "booked" in resp.lower(),
+                               20.0, "Timeout waiting for booking confirmation"):
+                    log.info("SUCCESS: Booking confirmed message received!")
+            finally:
+                reader.cancel()
                     
     except Exception as e:
-        print(f"Connection failed: {e}")
+        log.error(f"Connection failed: {e}")
 
 if __name__ == "__main__":
     asyncio.run(test_booking())